@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from dev.types.skill_types import ToolResult
@@ -24,194 +25,145 @@ def set_browser_client(client: Any) -> None:
   _browser_client = client
 
 
+# Tool name -> adapter mapping (client, args) onto the matching client call.
+# A single dict lookup per dispatch instead of walking an if/elif chain.
+HANDLERS: dict[str, Callable[[Any, dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+  # Navigation
+  "navigate": lambda c, a: c.navigate(
+    a.get("url"),
+    wait_until=a.get("wait_until", "load"),
+    timeout=a.get("timeout", 30000),
+  ),
+  "go_back": lambda c, a: c.go_back(timeout=a.get("timeout", 30000)),
+  "go_forward": lambda c, a: c.go_forward(timeout=a.get("timeout", 30000)),
+  "reload": lambda c, a: c.reload(
+    wait_until=a.get("wait_until", "load"), timeout=a.get("timeout", 30000)
+  ),
+  "get_url": lambda c, a: c.get_url(),
+  "get_title": lambda c, a: c.get_title(),
+  # Interaction
+  "click": lambda c, a: c.click(
+    a.get("selector"),
+    button=a.get("button", "left"),
+    click_count=a.get("click_count", 1),
+    delay=a.get("delay", 0),
+    force=a.get("force", False),
+  ),
+  "fill": lambda c, a: c.fill(a.get("selector"), a.get("text"), timeout=a.get("timeout", 30000)),
+  "type": lambda c, a: c.type_text(
+    a.get("selector"),
+    a.get("text"),
+    delay=a.get("delay", 0),
+    timeout=a.get("timeout", 30000),
+  ),
+  "press_key": lambda c, a: c.press_key(a.get("key"), delay=a.get("delay", 0)),
+  "select_option": lambda c, a: c.select_option(
+    a.get("selector"),
+    value=a.get("value"),
+    label=a.get("label"),
+    index=a.get("index"),
+    multiple=a.get("multiple", False),
+  ),
+  "check": lambda c, a: c.check(a.get("selector"), checked=a.get("checked", True)),
+  "hover": lambda c, a: c.hover(a.get("selector"), timeout=a.get("timeout", 30000)),
+  "scroll": lambda c, a: c.scroll(
+    selector=a.get("selector"),
+    direction=a.get("direction", "down"),
+    amount=a.get("amount", 500),
+  ),
+  # Content extraction
+  "get_text": lambda c, a: c.get_text(
+    selector=a.get("selector"), inner_text=a.get("inner_text", False)
+  ),
+  "get_html": lambda c, a: c.get_html(
+    selector=a.get("selector"), outer_html=a.get("outer_html", True)
+  ),
+  "get_attribute": lambda c, a: c.get_attribute(a.get("selector"), a.get("attribute")),
+  "screenshot": lambda c, a: c.screenshot(
+    selector=a.get("selector"),
+    path=a.get("path"),
+    full_page=a.get("full_page", False),
+    image_type=a.get("type", "png"),
+  ),
+  # JavaScript execution
+  "evaluate": lambda c, a: c.evaluate(a.get("script"), arg=a.get("arg")),
+  # Waiting
+  "wait_for_selector": lambda c, a: c.wait_for_selector(
+    a.get("selector"),
+    state=a.get("state", "visible"),
+    timeout=a.get("timeout", 30000),
+  ),
+  "wait_for_url": lambda c, a: c.wait_for_url(a.get("url"), timeout=a.get("timeout", 30000)),
+  # Cookies
+  "get_cookies": lambda c, a: c.get_cookies(urls=a.get("urls")),
+  "set_cookie": lambda c, a: c.set_cookie(
+    a.get("name"),
+    a.get("value"),
+    a.get("url"),
+    domain=a.get("domain"),
+    path=a.get("path", "/"),
+    expires=a.get("expires"),
+    http_only=a.get("http_only", False),
+    secure=a.get("secure", False),
+    same_site=a.get("same_site"),
+  ),
+  "clear_cookies": lambda c, a: c.clear_cookies(urls=a.get("urls")),
+  # Storage
+  "get_local_storage": lambda c, a: c.get_local_storage(key=a.get("key")),
+  "set_local_storage": lambda c, a: c.set_local_storage(a.get("key"), a.get("value")),
+  "clear_local_storage": lambda c, a: c.clear_local_storage(),
+  "get_session_storage": lambda c, a: c.get_session_storage(key=a.get("key")),
+  "set_session_storage": lambda c, a: c.set_session_storage(a.get("key"), a.get("value")),
+  "clear_session_storage": lambda c, a: c.clear_session_storage(),
+  # Network
+  "intercept_request": lambda c, a: c.intercept_request(
+    a.get("url_pattern"),
+    action=a.get("action", "continue"),
+    response_status=a.get("response_status", 200),
+    response_body=a.get("response_body"),
+    response_headers=a.get("response_headers"),
+  ),
+  "get_network_logs": lambda c, a: c.get_network_logs(
+    url_pattern=a.get("url_pattern"),
+    method=a.get("method"),
+    status=a.get("status"),
+  ),
+  # Pages/tabs
+  "new_page": lambda c, a: c.new_page(url=a.get("url")),
+  "get_pages": lambda c, a: c.get_pages(),
+  "switch_page": lambda c, a: c.switch_page(index=a.get("index"), url=a.get("url")),
+  "close_page": lambda c, a: c.close_page(),
+  # Dialogs
+  "handle_dialog": lambda c, a: c.handle_dialog(a.get("action"), prompt_text=a.get("prompt_text")),
+  # Files
+  "upload_file": lambda c, a: c.upload_file(
+    a.get("selector"),
+    a.get("file_path"),
+    multiple=a.get("multiple", False),
+  ),
+  "download_file": lambda c, a: c.download_file(
+    a.get("save_path"), url=a.get("url"), timeout=a.get("timeout", 30000)
+  ),
+}
+
+
 async def dispatch_tool(tool_name: str, args: dict[str, Any]) -> ToolResult:
   """Dispatch tool calls to appropriate handlers."""
-  global _browser_client
-
   if not _browser_client:
     return ToolResult(
       content="Browser not initialized. Please wait for browser to start.",
       is_error=True,
     )
 
-  try:
-    # Navigation
-    if tool_name == "navigate":
-      result = await _browser_client.navigate(
-        args.get("url"),
-        wait_until=args.get("wait_until", "load"),
-        timeout=args.get("timeout", 30000),
-      )
-    elif tool_name == "go_back":
-      result = await _browser_client.go_back(timeout=args.get("timeout", 30000))
-    elif tool_name == "go_forward":
-      result = await _browser_client.go_forward(timeout=args.get("timeout", 30000))
-    elif tool_name == "reload":
-      result = await _browser_client.reload(
-        wait_until=args.get("wait_until", "load"), timeout=args.get("timeout", 30000)
-      )
-    elif tool_name == "get_url":
-      result = await _browser_client.get_url()
-    elif tool_name == "get_title":
-      result = await _browser_client.get_title()
-
-    # Interaction
-    elif tool_name == "click":
-      result = await _browser_client.click(
-        args.get("selector"),
-        button=args.get("button", "left"),
-        click_count=args.get("click_count", 1),
-        delay=args.get("delay", 0),
-        force=args.get("force", False),
-      )
-    elif tool_name == "fill":
-      result = await _browser_client.fill(
-        args.get("selector"), args.get("text"), timeout=args.get("timeout", 30000)
-      )
-    elif tool_name == "type":
-      result = await _browser_client.type_text(
-        args.get("selector"),
-        args.get("text"),
-        delay=args.get("delay", 0),
-        timeout=args.get("timeout", 30000),
-      )
-    elif tool_name == "press_key":
-      result = await _browser_client.press_key(args.get("key"), delay=args.get("delay", 0))
-    elif tool_name == "select_option":
-      result = await _browser_client.select_option(
-        args.get("selector"),
-        value=args.get("value"),
-        label=args.get("label"),
-        index=args.get("index"),
-        multiple=args.get("multiple", False),
-      )
-    elif tool_name == "check":
-      result = await _browser_client.check(args.get("selector"), checked=args.get("checked", True))
-    elif tool_name == "hover":
-      result = await _browser_client.hover(args.get("selector"), timeout=args.get("timeout", 30000))
-    elif tool_name == "scroll":
-      result = await _browser_client.scroll(
-        selector=args.get("selector"),
-        direction=args.get("direction", "down"),
-        amount=args.get("amount", 500),
-      )
-
-    # Content extraction
-    elif tool_name == "get_text":
-      result = await _browser_client.get_text(
-        selector=args.get("selector"), inner_text=args.get("inner_text", False)
-      )
-    elif tool_name == "get_html":
-      result = await _browser_client.get_html(
-        selector=args.get("selector"), outer_html=args.get("outer_html", True)
-      )
-    elif tool_name == "get_attribute":
-      result = await _browser_client.get_attribute(args.get("selector"), args.get("attribute"))
-    elif tool_name == "screenshot":
-      result = await _browser_client.screenshot(
-        selector=args.get("selector"),
-        path=args.get("path"),
-        full_page=args.get("full_page", False),
-        image_type=args.get("type", "png"),
-      )
-
-    # JavaScript execution
-    elif tool_name == "evaluate":
-      result = await _browser_client.evaluate(args.get("script"), arg=args.get("arg"))
-
-    # Waiting
-    elif tool_name == "wait_for_selector":
-      result = await _browser_client.wait_for_selector(
-        args.get("selector"),
-        state=args.get("state", "visible"),
-        timeout=args.get("timeout", 30000),
-      )
-    elif tool_name == "wait_for_url":
-      result = await _browser_client.wait_for_url(
-        args.get("url"), timeout=args.get("timeout", 30000)
-      )
-
-    # Cookies
-    elif tool_name == "get_cookies":
-      result = await _browser_client.get_cookies(urls=args.get("urls"))
-    elif tool_name == "set_cookie":
-      result = await _browser_client.set_cookie(
-        args.get("name"),
-        args.get("value"),
-        args.get("url"),
-        domain=args.get("domain"),
-        path=args.get("path", "/"),
-        expires=args.get("expires"),
-        http_only=args.get("http_only", False),
-        secure=args.get("secure", False),
-        same_site=args.get("same_site"),
-      )
-    elif tool_name == "clear_cookies":
-      result = await _browser_client.clear_cookies(urls=args.get("urls"))
-
-    # Storage
-    elif tool_name == "get_local_storage":
-      result = await _browser_client.get_local_storage(key=args.get("key"))
-    elif tool_name == "set_local_storage":
-      result = await _browser_client.set_local_storage(args.get("key"), args.get("value"))
-    elif tool_name == "clear_local_storage":
-      result = await _browser_client.clear_local_storage()
-    elif tool_name == "get_session_storage":
-      result = await _browser_client.get_session_storage(key=args.get("key"))
-    elif tool_name == "set_session_storage":
-      result = await _browser_client.set_session_storage(args.get("key"), args.get("value"))
-    elif tool_name == "clear_session_storage":
-      result = await _browser_client.clear_session_storage()
-
-    # Network
-    elif tool_name == "intercept_request":
-      result = await _browser_client.intercept_request(
-        args.get("url_pattern"),
-        action=args.get("action", "continue"),
-        response_status=args.get("response_status", 200),
-        response_body=args.get("response_body"),
-        response_headers=args.get("response_headers"),
-      )
-    elif tool_name == "get_network_logs":
-      result = await _browser_client.get_network_logs(
-        url_pattern=args.get("url_pattern"),
-        method=args.get("method"),
-        status=args.get("status"),
-      )
-
-    # Pages/tabs
-    elif tool_name == "new_page":
-      result = await _browser_client.new_page(url=args.get("url"))
-    elif tool_name == "get_pages":
-      result = await _browser_client.get_pages()
-    elif tool_name == "switch_page":
-      result = await _browser_client.switch_page(index=args.get("index"), url=args.get("url"))
-    elif tool_name == "close_page":
-      result = await _browser_client.close_page()
-
-    # Dialogs
-    elif tool_name == "handle_dialog":
-      result = await _browser_client.handle_dialog(
-        args.get("action"), prompt_text=args.get("prompt_text")
-      )
-
-    # Files
-    elif tool_name == "upload_file":
-      result = await _browser_client.upload_file(
-        args.get("selector"),
-        args.get("file_path"),
-        multiple=args.get("multiple", False),
-      )
-    elif tool_name == "download_file":
-      result = await _browser_client.download_file(
-        args.get("save_path"), url=args.get("url"), timeout=args.get("timeout", 30000)
-      )
+  handler = HANDLERS.get(tool_name)
+  if handler is None:
+    return ToolResult(
+      content=f"Unknown tool: {tool_name}",
+      is_error=True,
+    )
 
-    else:
-      return ToolResult(
-        content=f"Unknown tool: {tool_name}",
-        is_error=True,
-      )
+  try:
+    result = await handler(_browser_client, args)
 
     # Format result
     if result.get("success"):
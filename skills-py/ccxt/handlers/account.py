@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client.ccxt_client import get_ccxt_manager
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error
+from ..helpers import NOT_INITIALIZED, ErrorCategory, ToolResult, log_and_format_error
 from ..validation import req_list, req_string
 
 
@@ -44,10 +44,7 @@ async def get_exchange_info(args: dict[str, Any]) -> ToolResult:
     exchange_id = req_string(args, "exchange_id")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(
-        content="CCXT manager not initialized.",
-        is_error=True,
-      )
+      return NOT_INITIALIZED
 
     config = manager.get_config(exchange_id)
     if not config:
@@ -74,10 +71,7 @@ async def test_connection(args: dict[str, Any]) -> ToolResult:
     exchange_id = req_string(args, "exchange_id")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(
-        content="CCXT manager not initialized.",
-        is_error=True,
-      )
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -106,10 +100,7 @@ async def get_available_exchanges(args: dict[str, Any]) -> ToolResult:
   try:
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(
-        content="CCXT manager not initialized.",
-        is_error=True,
-      )
+      return NOT_INITIALIZED
 
     exchanges = manager.get_available_exchanges()
     return ToolResult(content=f"Available exchanges ({len(exchanges)}):\n" + ", ".join(exchanges))
@@ -125,10 +116,7 @@ async def update_exchange_settings(args: dict[str, Any]) -> ToolResult:
 
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(
-        content="CCXT manager not initialized.",
-        is_error=True,
-      )
+      return NOT_INITIALIZED
 
     config = manager.get_config(exchange_id)
     if not config:
@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client.ccxt_client import get_ccxt_manager
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error
+from ..helpers import NOT_INITIALIZED, ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_number, opt_string_list, req_string
 
 
@@ -18,7 +18,7 @@ async def fetch_ticker(args: dict[str, Any]) -> ToolResult:
     symbol = req_string(args, "symbol")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -47,7 +47,7 @@ async def fetch_tickers(args: dict[str, Any]) -> ToolResult:
     symbols = opt_string_list(args, "symbols")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -80,7 +80,7 @@ async def fetch_orderbook(args: dict[str, Any]) -> ToolResult:
     limit = opt_number(args, "limit", 20)
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -112,7 +112,7 @@ async def fetch_trades(args: dict[str, Any]) -> ToolResult:
     limit = opt_number(args, "limit", 50)
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -140,7 +140,7 @@ async def fetch_ohlcv(args: dict[str, Any]) -> ToolResult:
     limit = opt_number(args, "limit", 100)
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -163,7 +163,7 @@ async def fetch_markets(args: dict[str, Any]) -> ToolResult:
     exchange_id = req_string(args, "exchange_id")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
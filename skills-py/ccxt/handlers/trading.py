@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client.ccxt_client import get_ccxt_manager
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error
+from ..helpers import NOT_INITIALIZED, ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_list, opt_number, opt_string, req_string
 
 
@@ -17,7 +17,7 @@ async def fetch_balance(args: dict[str, Any]) -> ToolResult:
     exchange_id = req_string(args, "exchange_id")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -62,7 +62,7 @@ async def create_order(args: dict[str, Any]) -> ToolResult:
 
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -116,7 +116,7 @@ async def cancel_order(args: dict[str, Any]) -> ToolResult:
     symbol = req_string(args, "symbol")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -136,7 +136,7 @@ async def fetch_order(args: dict[str, Any]) -> ToolResult:
     symbol = req_string(args, "symbol")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -166,7 +166,7 @@ async def fetch_orders(args: dict[str, Any]) -> ToolResult:
     symbol = opt_string(args, "symbol")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -178,12 +178,7 @@ async def fetch_orders(args: dict[str, Any]) -> ToolResult:
       orders = await exchange.fetch_orders()
 
     lines = [f"Orders on {exchange_id}:"]
-    for order in orders[:20]:  # Limit display
-      lines.append(
-        f"  {order.get('id', 'N/A')}: {order.get('symbol', 'N/A')} "
-        f"{order.get('side', 'N/A')} {order.get('amount', 'N/A')} @ "
-        f"{order.get('price', 'N/A')} [{order.get('status', 'N/A')}]"
-      )
+    lines.extend(map(_order_status_line, orders[:20]))  # Limit display
 
     if len(orders) > 20:
       lines.append(f"\n... and {len(orders) - 20} more")
@@ -200,7 +195,7 @@ async def fetch_open_orders(args: dict[str, Any]) -> ToolResult:
     symbol = opt_string(args, "symbol")
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -212,12 +207,7 @@ async def fetch_open_orders(args: dict[str, Any]) -> ToolResult:
       orders = await exchange.fetch_open_orders()
 
     lines = [f"Open orders on {exchange_id}:"]
-    for order in orders[:20]:
-      lines.append(
-        f"  {order.get('id', 'N/A')}: {order.get('symbol', 'N/A')} "
-        f"{order.get('side', 'N/A')} {order.get('amount', 'N/A')} @ "
-        f"{order.get('price', 'N/A')}"
-      )
+    lines.extend(map(_order_line, orders[:20]))
 
     if not orders:
       lines.append("  No open orders")
@@ -235,7 +225,7 @@ async def fetch_closed_orders(args: dict[str, Any]) -> ToolResult:
     limit = opt_number(args, "limit", 50)
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -247,12 +237,7 @@ async def fetch_closed_orders(args: dict[str, Any]) -> ToolResult:
       orders = await exchange.fetch_closed_orders(limit=limit)
 
     lines = [f"Closed orders on {exchange_id}:"]
-    for order in orders[:20]:
-      lines.append(
-        f"  {order.get('id', 'N/A')}: {order.get('symbol', 'N/A')} "
-        f"{order.get('side', 'N/A')} {order.get('amount', 'N/A')} @ "
-        f"{order.get('price', 'N/A')} [{order.get('status', 'N/A')}]"
-      )
+    lines.extend(map(_order_status_line, orders[:20]))
 
     if not orders:
       lines.append("  No closed orders")
@@ -270,7 +255,7 @@ async def fetch_my_trades(args: dict[str, Any]) -> ToolResult:
     limit = opt_number(args, "limit", 50)
     manager = get_ccxt_manager()
     if not manager:
-      return ToolResult(content="CCXT manager not initialized.", is_error=True)
+      return NOT_INITIALIZED
 
     exchange = manager.get_exchange(exchange_id)
     if not exchange:
@@ -282,12 +267,7 @@ async def fetch_my_trades(args: dict[str, Any]) -> ToolResult:
       trades = await exchange.fetch_my_trades(limit=limit)
 
     lines = [f"Trade history on {exchange_id}:"]
-    for trade in trades[:20]:
-      lines.append(
-        f"  {trade.get('id', 'N/A')}: {trade.get('symbol', 'N/A')} "
-        f"{trade.get('side', 'N/A')} {trade.get('amount', 'N/A')} @ "
-        f"{trade.get('price', 'N/A')} (Fee: {trade.get('fee', {}).get('cost', 'N/A')})"
-      )
+    lines.extend(map(_trade_line, trades[:20]))
 
     if not trades:
       lines.append("  No trades found")
@@ -295,3 +275,24 @@ async def fetch_my_trades(args: dict[str, Any]) -> ToolResult:
     return ToolResult(content="\n".join(lines))
   except Exception as e:
     return log_and_format_error("fetch_my_trades", e, ErrorCategory.TRADING)
+
+
+def _order_line(order: dict[str, Any]) -> str:
+  """Format an order or trade row as "id: symbol side amount @ price"."""
+  get = order.get
+  return (
+    f"  {get('id', 'N/A')}: {get('symbol', 'N/A')} "
+    f"{get('side', 'N/A')} {get('amount', 'N/A')} @ {get('price', 'N/A')}"
+  )
+
+
+def _order_status_line(order: dict[str, Any]) -> str:
+  """Format an order row with its status appended."""
+  return f"{_order_line(order)} [{order.get('status', 'N/A')}]"
+
+
+def _trade_line(trade: dict[str, Any]) -> str:
+  """Format a trade row with its fee appended."""
+  # ccxt reports fee as None when the exchange omits it
+  fee = trade.get("fee") or {}
+  return f"{_order_line(trade)} (Fee: {fee.get('cost', 'N/A')})"
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from enum import Enum
+
+from .validation import ValidationError
 
 log = logging.getLogger("skill.ccxt.helpers")
 
@@ -16,18 +17,23 @@ log = logging.getLogger("skill.ccxt.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
 
 
+# Shared result for the common "not set up yet" path; safe to reuse since
+# ToolResult is frozen.
+NOT_INITIALIZED = ToolResult(content="CCXT manager not initialized.", is_error=True)
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
 
 
-class ErrorCategory(str, Enum):
+class ErrorCategory:
   ACCOUNT = "ACCOUNT"
   MARKET = "MARKET"
   TRADING = "TRADING"
@@ -38,16 +44,14 @@ class ErrorCategory(str, Enum):
 def log_and_format_error(
   function_name: str,
   error: Exception,
-  category: str | ErrorCategory | None = None,
+  category: str | None = None,
 ) -> ToolResult:
-  prefix = category.value if isinstance(category, ErrorCategory) else (category or "GEN")
+  prefix = category or "GEN"
   hash_val = sum(ord(c) for c in function_name) % 1000
   error_code = f"{prefix}-ERR-{hash_val:03d}"
 
   log.error("[MCP] Error in %s - Code: %s - %s", function_name, error_code, error)
 
-  from .validation import ValidationError
-
   if isinstance(error, ValidationError):
     user_message = str(error)
   else:
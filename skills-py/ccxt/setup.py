@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from dev.types.setup_types import (
@@ -186,10 +187,9 @@ async def on_setup_start(ctx: Any) -> SetupStep:
 
 async def on_setup_submit(ctx: Any, step_id: str, values: dict[str, Any]) -> SetupResult:
   """Validate and process a submitted step."""
-  if step_id == "exchange_list":
-    return await _handle_exchange_list(ctx, values)
-  if step_id == "exchange_add":
-    return await _handle_exchange_add(ctx, values)
+  handler = _STEP_HANDLERS.get(step_id)
+  if handler is not None:
+    return await handler(ctx, values)
 
   return SetupResult(
     status="error",
@@ -388,3 +388,10 @@ async def _handle_exchange_add(ctx: Any, values: dict[str, Any]) -> SetupResult:
     status="next",
     next_step=_make_exchange_list_step(_exchanges),
   )
+
+
+# step_id -> submit handler, built once the handlers above are defined
+_STEP_HANDLERS: dict[str, Callable[[Any, dict[str, Any]], Awaitable[SetupResult]]] = {
+  "exchange_list": _handle_exchange_list,
+  "exchange_add": _handle_exchange_add,
+}
@@ -39,7 +39,7 @@ def opt_string_list(args: dict[str, Any], key: str) -> list[str] | None:
   if v is None:
     return None
   if isinstance(v, str):
-    return [p.strip() for p in v.split(",") if p.strip()]
+    return [p for p in map(str.strip, v.split(",")) if p]
   if isinstance(v, list):
     return [str(p).strip() for p in v if p]
   return None
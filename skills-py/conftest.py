@@ -0,0 +1,22 @@
+"""
+Test setup: expose this directory as the ``skills`` package.
+
+The runtime imports each skill as ``skills.<name>`` (``python -m skills.email``),
+but in this checkout the directory is named ``skills-py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+if "skills" not in sys.modules:
+  _root = Path(__file__).parent
+  _spec = importlib.util.spec_from_file_location(
+    "skills", _root / "__init__.py", submodule_search_locations=[str(_root)]
+  )
+  assert _spec is not None and _spec.loader is not None
+  _module = importlib.util.module_from_spec(_spec)
+  sys.modules["skills"] = _module
+  _spec.loader.exec_module(_module)
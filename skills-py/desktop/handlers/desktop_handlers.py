@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from dev.types.skill_types import ToolResult
@@ -24,91 +25,78 @@ def set_desktop_client(client: Any) -> None:
   _desktop_client = client
 
 
+# Tool name -> adapter mapping (client, args) onto the matching client call.
+# A single dict lookup per dispatch instead of walking an if/elif chain.
+HANDLERS: dict[str, Callable[[Any, dict[str, Any]], dict[str, Any]]] = {
+  # Mouse operations
+  "mouse_move": lambda c, a: c.mouse_move(
+    a.get("x"),
+    a.get("y"),
+    absolute=a.get("absolute", True),
+    duration=a.get("duration", 0),
+  ),
+  "mouse_click": lambda c, a: c.mouse_click(
+    button=a.get("button", "left"),
+    clicks=a.get("clicks", 1),
+    x=a.get("x"),
+    y=a.get("y"),
+    interval=a.get("interval", 0.1),
+  ),
+  "mouse_press": lambda c, a: c.mouse_press(button=a.get("button", "left")),
+  "mouse_release": lambda c, a: c.mouse_release(button=a.get("button", "left")),
+  "mouse_scroll": lambda c, a: c.mouse_scroll(
+    dx=a.get("dx", 0),
+    dy=a.get("dy", 0),
+    x=a.get("x"),
+    y=a.get("y"),
+  ),
+  "mouse_drag": lambda c, a: c.mouse_drag(
+    a.get("x1"),
+    a.get("y1"),
+    a.get("x2"),
+    a.get("y2"),
+    button=a.get("button", "left"),
+    duration=a.get("duration", 0.5),
+  ),
+  "mouse_position": lambda c, a: c.mouse_position(),
+  # Keyboard operations
+  "keyboard_type": lambda c, a: c.keyboard_type(a.get("text"), interval=a.get("interval", 0.05)),
+  "keyboard_press": lambda c, a: c.keyboard_press(a.get("key")),
+  "keyboard_release": lambda c, a: c.keyboard_release(a.get("key")),
+  "keyboard_tap": lambda c, a: c.keyboard_tap(a.get("key")),
+  "keyboard_hotkey": lambda c, a: c.keyboard_hotkey(a.get("keys", [])),
+  "keyboard_write": lambda c, a: c.keyboard_write(a.get("text")),
+  # Screen operations
+  "screen_capture": lambda c, a: c.screen_capture(
+    x=a.get("x"),
+    y=a.get("y"),
+    width=a.get("width"),
+    height=a.get("height"),
+    save_path=a.get("save_path"),
+  ),
+  "screen_size": lambda c, a: c.screen_size(),
+  # Utility operations
+  "wait": lambda c, a: c.wait(a.get("seconds")),
+}
+
+
 async def dispatch_tool(tool_name: str, args: dict[str, Any]) -> ToolResult:
   """Dispatch tool calls to appropriate handlers."""
-  global _desktop_client
-
   if not _desktop_client:
     return ToolResult(
       content="Desktop client not initialized. Please wait for client to start.",
       is_error=True,
     )
 
-  try:
-    # Mouse operations
-    if tool_name == "mouse_move":
-      result = _desktop_client.mouse_move(
-        args.get("x"),
-        args.get("y"),
-        absolute=args.get("absolute", True),
-        duration=args.get("duration", 0),
-      )
-    elif tool_name == "mouse_click":
-      result = _desktop_client.mouse_click(
-        button=args.get("button", "left"),
-        clicks=args.get("clicks", 1),
-        x=args.get("x"),
-        y=args.get("y"),
-        interval=args.get("interval", 0.1),
-      )
-    elif tool_name == "mouse_press":
-      result = _desktop_client.mouse_press(button=args.get("button", "left"))
-    elif tool_name == "mouse_release":
-      result = _desktop_client.mouse_release(button=args.get("button", "left"))
-    elif tool_name == "mouse_scroll":
-      result = _desktop_client.mouse_scroll(
-        dx=args.get("dx", 0),
-        dy=args.get("dy", 0),
-        x=args.get("x"),
-        y=args.get("y"),
-      )
-    elif tool_name == "mouse_drag":
-      result = _desktop_client.mouse_drag(
-        args.get("x1"),
-        args.get("y1"),
-        args.get("x2"),
-        args.get("y2"),
-        button=args.get("button", "left"),
-        duration=args.get("duration", 0.5),
-      )
-    elif tool_name == "mouse_position":
-      result = _desktop_client.mouse_position()
-
-    # Keyboard operations
-    elif tool_name == "keyboard_type":
-      result = _desktop_client.keyboard_type(args.get("text"), interval=args.get("interval", 0.05))
-    elif tool_name == "keyboard_press":
-      result = _desktop_client.keyboard_press(args.get("key"))
-    elif tool_name == "keyboard_release":
-      result = _desktop_client.keyboard_release(args.get("key"))
-    elif tool_name == "keyboard_tap":
-      result = _desktop_client.keyboard_tap(args.get("key"))
-    elif tool_name == "keyboard_hotkey":
-      result = _desktop_client.keyboard_hotkey(args.get("keys", []))
-    elif tool_name == "keyboard_write":
-      result = _desktop_client.keyboard_write(args.get("text"))
-
-    # Screen operations
-    elif tool_name == "screen_capture":
-      result = _desktop_client.screen_capture(
-        x=args.get("x"),
-        y=args.get("y"),
-        width=args.get("width"),
-        height=args.get("height"),
-        save_path=args.get("save_path"),
-      )
-    elif tool_name == "screen_size":
-      result = _desktop_client.screen_size()
-
-    # Utility operations
-    elif tool_name == "wait":
-      result = _desktop_client.wait(args.get("seconds"))
+  handler = HANDLERS.get(tool_name)
+  if handler is None:
+    return ToolResult(
+      content=f"Unknown tool: {tool_name}",
+      is_error=True,
+    )
 
-    else:
-      return ToolResult(
-        content=f"Unknown tool: {tool_name}",
-        is_error=True,
-      )
+  try:
+    result = handler(_desktop_client, args)
 
     # Format result
     if result.get("success"):
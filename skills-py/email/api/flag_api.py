@@ -5,11 +5,15 @@ Email flag/manage operations API (mark read, flag, move, delete, archive).
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from ..client.imap_client import get_imap_client
 from ..db.connection import get_db
 from ..db.queries import delete_cached_email, update_email_flags
 
+if TYPE_CHECKING:
+  from ..client.imap_client import ImapClient
+
 log = logging.getLogger("skill.email.api.flag")
 
 _account_id: str = ""
@@ -20,21 +24,18 @@ def set_account_id(account_id: str) -> None:
   _account_id = account_id
 
 
-async def _ensure_folder(folder: str) -> None:
-  """Select the folder on the IMAP client."""
+async def _ensure_folder(folder: str) -> ImapClient:
+  """Select the folder on the IMAP client and return the connected client."""
   client = get_imap_client()
   if not client or not await client.ensure_connected():
     raise RuntimeError("IMAP not connected")
   await client.select_folder(folder)
+  return client
 
 
 async def mark_read(uids: list[int], folder: str = "INBOX") -> bool:
   """Mark messages as read (set \\Seen flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
+  client = await _ensure_folder(folder)
   result = await client.store_flags(uids, r"(\Seen)", "+FLAGS")
   if result:
     db = await get_db()
@@ -45,11 +46,7 @@ async def mark_read(uids: list[int], folder: str = "INBOX") -> bool:
 
 async def mark_unread(uids: list[int], folder: str = "INBOX") -> bool:
   """Mark messages as unread (remove \\Seen flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
+  client = await _ensure_folder(folder)
   result = await client.store_flags(uids, r"(\Seen)", "-FLAGS")
   if result:
     db = await get_db()
@@ -60,11 +57,7 @@ async def mark_unread(uids: list[int], folder: str = "INBOX") -> bool:
 
 async def flag_message(uids: list[int], folder: str = "INBOX") -> bool:
   """Star/flag messages (set \\Flagged flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
+  client = await _ensure_folder(folder)
   result = await client.store_flags(uids, r"(\Flagged)", "+FLAGS")
   if result:
     db = await get_db()
@@ -75,11 +68,7 @@ async def flag_message(uids: list[int], folder: str = "INBOX") -> bool:
 
 async def unflag_message(uids: list[int], folder: str = "INBOX") -> bool:
   """Remove star/flag from messages."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
+  client = await _ensure_folder(folder)
   result = await client.store_flags(uids, r"(\Flagged)", "-FLAGS")
   if result:
     db = await get_db()
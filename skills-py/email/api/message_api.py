@@ -6,19 +6,22 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..client.imap_client import get_imap_client
 from ..db.connection import get_db
 from ..db.queries import (
   count_emails,
   count_unread,
+  count_unread_by_folder,
   get_cached_email,
-  get_thread_emails,
+  get_thread_emails_for_uid,
   list_cached_emails,
   search_cached_emails,
   upsert_contact,
+  upsert_contacts_batch,
   upsert_email,
+  upsert_emails_batch,
 )
 
 if TYPE_CHECKING:
@@ -39,12 +42,21 @@ def get_account_id() -> str:
   return _account_id
 
 
+def _is_empty(status: dict[str, Any] | None) -> bool:
+  """Whether a SELECT status reports zero messages, making a SEARCH pointless."""
+  return status is not None and status.get("exists") == 0
+
+
 async def list_messages(
   folder: str = "INBOX",
   limit: int = 20,
   offset: int = 0,
 ) -> list[ParsedEmail]:
   """List messages in a folder. Uses cache, falls back to IMAP."""
+  # An empty page is empty on both paths (SQL LIMIT 0 returns no rows)
+  if limit <= 0:
+    return []
+
   db = await get_db()
 
   # Try cache first
@@ -58,7 +70,7 @@ async def list_messages(
     return []
 
   status = await client.select_folder(folder)
-  if not status:
+  if not status or _is_empty(status):
     return []
 
   # Search recent UIDs
@@ -66,17 +78,23 @@ async def list_messages(
   if not uids:
     return []
 
-  # Take last `limit + offset` UIDs (most recent)
-  relevant_uids = uids[-(limit + offset) :]
-  if offset:
-    relevant_uids = relevant_uids[:limit]
+  # Take `limit` UIDs from the window of the last `limit + offset` (most recent),
+  # in a single slice
+  start = max(len(uids) - limit - offset, 0)
+  relevant_uids = uids[start : start + limit]
 
   emails = await client.fetch_envelopes(relevant_uids)
   if emails:
+    await upsert_emails_batch(db, _account_id, folder, emails)
+    contacts: dict[str, tuple[str | None, int]] = {}
     for email_obj in emails:
-      await upsert_email(db, _account_id, folder, email_obj)
       if email_obj.from_addr:
-        await upsert_contact(db, email_obj.from_addr.email, email_obj.from_addr.display_name)
+        prev_name, count = contacts.get(email_obj.from_addr.email, (None, 0))
+        contacts[email_obj.from_addr.email] = (
+          email_obj.from_addr.display_name or prev_name,
+          count + 1,
+        )
+    await upsert_contacts_batch(db, contacts)
 
   return emails
 
@@ -148,10 +166,9 @@ async def search_messages(
 
   criteria = " ".join(criteria_parts) if criteria_parts else "ALL"
 
-  if folder:
-    await client.select_folder(folder)
-  else:
-    await client.select_folder("INBOX")
+  status = await client.select_folder(folder or "INBOX")
+  if _is_empty(status):
+    return []
 
   uids = await client.search_messages(criteria)
   if not uids:
@@ -164,8 +181,7 @@ async def search_messages(
   # Cache results
   db = await get_db()
   target_folder = folder or "INBOX"
-  for email_obj in emails:
-    await upsert_email(db, _account_id, target_folder, email_obj)
+  await upsert_emails_batch(db, _account_id, target_folder, emails)
 
   return emails
 
@@ -178,10 +194,12 @@ async def get_unread_messages(
   client = get_imap_client()
   if not client or not await client.ensure_connected():
     db = await get_db()
-    cached = await list_cached_emails(db, _account_id, folder, limit)
-    return [e for e in cached if not e.is_read]
+    return await list_cached_emails(db, _account_id, folder, limit, unread_only=True)
+
+  status = await client.select_folder(folder)
+  if _is_empty(status):
+    return []
 
-  await client.select_folder(folder)
   uids = await client.search_messages("UNSEEN")
   if not uids:
     return []
@@ -197,12 +215,14 @@ async def get_thread(
   """Get all messages in a thread."""
   db = await get_db()
 
-  # First, get the message to find its thread_id
-  msg = await get_cached_email(db, _account_id, folder, message_id)
-  if not msg or not msg.thread_id:
-    return [msg] if msg else []
+  # Resolve the thread_id and its members in one round-trip
+  thread = await get_thread_emails_for_uid(db, _account_id, folder, message_id)
+  if thread:
+    return thread
 
-  return await get_thread_emails(db, _account_id, msg.thread_id)
+  # Not cached or not threaded — return the message alone if we have it
+  msg = await get_cached_email(db, _account_id, folder, message_id)
+  return [msg] if msg else []
 
 
 async def count_folder_messages(folder: str = "INBOX") -> int:
@@ -217,6 +237,12 @@ async def get_unread_count(folder: str | None = None) -> int:
   return await count_unread(db, _account_id, folder)
 
 
+async def get_unread_counts(folders: list[str]) -> dict[str, int]:
+  """Get unread counts for several folders in one query."""
+  db = await get_db()
+  return await count_unread_by_folder(db, _account_id, folders)
+
+
 async def get_recent_messages(
   hours: int = 24,
   folder: str = "INBOX",
@@ -226,11 +252,12 @@ async def get_recent_messages(
   client = get_imap_client()
   if not client or not await client.ensure_connected():
     db = await get_db()
-    all_msgs = await list_cached_emails(db, _account_id, folder, limit * 2)
     cutoff = time.time() - (hours * 3600)
-    return [m for m in all_msgs if m.date >= cutoff][:limit]
+    return await list_cached_emails(db, _account_id, folder, limit, since=cutoff)
 
-  await client.select_folder(folder)
+  status = await client.select_folder(folder)
+  if _is_empty(status):
+    return []
 
   # IMAP SINCE uses date only (not time), so we search a bit broader
   import datetime
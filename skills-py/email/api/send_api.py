@@ -53,15 +53,15 @@ async def reply_to_email(
     to_addrs.append(original.from_addr.email)
 
   if reply_all:
-    account_id = get_account_id()
+    own = get_account_id().lower()
     # Add To and CC from original, excluding ourselves
     for addr in original.to_addrs:
-      if addr.email.lower() != account_id.lower() and addr.email not in to_addrs:
+      if addr.email.lower() != own and addr.email not in to_addrs:
         to_addrs.append(addr.email)
     cc_list = [
       addr.email
       for addr in original.cc_addrs
-      if addr.email.lower() != account_id.lower() and addr.email not in to_addrs
+      if addr.email.lower() != own and addr.email not in to_addrs
     ]
     if cc_list:
       cc_addrs = cc_list
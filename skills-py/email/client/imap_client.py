@@ -10,6 +10,7 @@ import asyncio
 import contextlib
 import logging
 import re
+import time
 from typing import TYPE_CHECKING, Any
 
 from aioimaplib import IMAP4, IMAP4_SSL
@@ -21,6 +22,23 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("skill.email.client.imap")
 
+# A NOOP that succeeded this recently is taken as proof the session is alive.
+# API wrappers and the client methods they call each check the connection, so
+# without this a single tool call (or a per-folder loop) pays several NOOPs.
+LIVENESS_TTL_S = 5.0
+
+# SELECT/EXAMINE untagged counts, matched against the upper-cased line
+_SELECT_COUNTS = (
+  ("exists", re.compile(r"(\d+)\s+EXISTS")),
+  ("recent", re.compile(r"(\d+)\s+RECENT")),
+  ("uidvalidity", re.compile(r"UIDVALIDITY\s+(\d+)")),
+  ("uidnext", re.compile(r"UIDNEXT\s+(\d+)")),
+  ("unseen", re.compile(r"UNSEEN\s+(\d+)")),
+)
+# LIST response: (\flags) "delimiter" "name", with or without quotes on the name
+_LIST_QUOTED_RE = re.compile(r'\(([^)]*)\)\s+"([^"]+)"\s+"?([^"]+)"?')
+_LIST_BARE_RE = re.compile(r'\(([^)]*)\)\s+"([^"]+)"\s+(.+)')
+
 _client: ImapClient | None = None
 
 
@@ -41,6 +59,7 @@ class ImapClient:
     self._password: str = ""
     self._current_folder: str | None = None
     self._lock = asyncio.Lock()
+    self._verified_at: float = 0.0
     self.is_connected: bool = False
 
   async def connect(self, email: str, password: str) -> bool:
@@ -66,6 +85,7 @@ class ImapClient:
           return False
 
         self.is_connected = True
+        self._verified_at = time.monotonic()
         self._current_folder = None
         log.info("IMAP connected to %s as %s", self.host, self._email)
         return True
@@ -74,12 +94,20 @@ class ImapClient:
         self.is_connected = False
         return False
 
-  async def ensure_connected(self) -> bool:
-    """Ensure the client is connected, reconnecting if needed."""
+  async def ensure_connected(self, fresh: bool = False) -> bool:
+    """Ensure the client is connected, reconnecting if needed.
+
+    Skips the NOOP round-trip if one succeeded within LIVENESS_TTL_S, unless
+    ``fresh`` is set.
+    """
     if self.is_connected and self._imap:
+      now = time.monotonic()
+      if not fresh and now - self._verified_at < LIVENESS_TTL_S:
+        return True
       try:
         response = await self._imap.noop()
         if response.result == "OK":
+          self._verified_at = now
           return True
       except Exception:
         pass
@@ -104,7 +132,10 @@ class ImapClient:
       return False
     try:
       response = await self._imap.noop()
-      return response.result == "OK"
+      if response.result != "OK":
+        return False
+      self._verified_at = time.monotonic()
+      return True
     except Exception:
       self.is_connected = False
       return False
@@ -197,7 +228,7 @@ class ImapClient:
     if not self._imap or not self.is_connected or not uids:
       return []
 
-    uid_str = ",".join(str(u) for u in uids)
+    uid_str = _uid_set(uids)
     try:
       response = await self._imap.uid(
         "fetch",
@@ -235,7 +266,7 @@ class ImapClient:
     if not self._imap or not self.is_connected:
       return False
 
-    uid_str = ",".join(str(u) for u in uids)
+    uid_str = _uid_set(uids)
     try:
       response = await self._imap.uid("store", uid_str, action, flags)
       return response.result == "OK"
@@ -248,7 +279,7 @@ class ImapClient:
     if not self._imap or not self.is_connected:
       return False
 
-    uid_str = ",".join(str(u) for u in uids)
+    uid_str = _uid_set(uids)
     try:
       response = await self._imap.uid("copy", uid_str, dest_folder)
       return response.result == "OK"
@@ -340,6 +371,11 @@ def get_imap_client() -> ImapClient | None:
 # ---------------------------------------------------------------------------
 
 
+def _uid_set(uids: list[int]) -> str:
+  """Format UIDs as an IMAP sequence set ("1,2,3")."""
+  return ",".join(map(str, uids))
+
+
 def _parse_select_response(lines: list[str]) -> dict[str, Any]:
   """Parse SELECT/EXAMINE response for counts and UIDVALIDITY."""
   result: dict[str, Any] = {}
@@ -347,39 +383,20 @@ def _parse_select_response(lines: list[str]) -> dict[str, Any]:
     if not isinstance(line, str):
       continue
     line_upper = line.upper()
-    # Parse "N EXISTS"
-    m = re.search(r"(\d+)\s+EXISTS", line_upper)
-    if m:
-      result["exists"] = int(m.group(1))
-    # Parse "N RECENT"
-    m = re.search(r"(\d+)\s+RECENT", line_upper)
-    if m:
-      result["recent"] = int(m.group(1))
-    # Parse "UIDVALIDITY N"
-    m = re.search(r"UIDVALIDITY\s+(\d+)", line_upper)
-    if m:
-      result["uidvalidity"] = int(m.group(1))
-    # Parse "UIDNEXT N"
-    m = re.search(r"UIDNEXT\s+(\d+)", line_upper)
-    if m:
-      result["uidnext"] = int(m.group(1))
-    # Parse "UNSEEN N"
-    m = re.search(r"UNSEEN\s+(\d+)", line_upper)
-    if m:
-      result["unseen"] = int(m.group(1))
+    for key, pattern in _SELECT_COUNTS:
+      m = pattern.search(line_upper)
+      if m:
+        result[key] = int(m.group(1))
   return result
 
 
 def _parse_list_response(line: str) -> dict[str, str] | None:
   """Parse a single LIST response line."""
-  # Format: (\flags) "delimiter" "name"
-  m = re.match(r'\(([^)]*)\)\s+"([^"]+)"\s+"?([^"]+)"?', line)
-  if not m:
-    # Try without quotes on name
-    m = re.match(r'\(([^)]*)\)\s+"([^"]+)"\s+(.+)', line)
+  m = _LIST_QUOTED_RE.match(line) or _LIST_BARE_RE.match(line)
   if not m:
     return None
 
   flags_str, delimiter, name = m.group(1), m.group(2), m.group(3)
-  flags: list[str] = [f.strip() for f in flags_str.split() if f.strip()]
+  # split() with no separator already drops whitespace and empty items
+  flags: list[str] = flags_str.split()
   return {"name": name.strip('"'), "delimiter": delimiter, "flags": flags}
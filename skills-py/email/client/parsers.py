@@ -9,6 +9,7 @@ from __future__ import annotations
 import email
 import email.policy
 import email.utils
+import functools
 import logging
 import re
 import time
@@ -26,6 +27,21 @@ MAX_HTML_SIZE = 100_000
 # Preview length
 PREVIEW_LENGTH = 200
 
+# FETCH response and header patterns, compiled once
+_UID_RE = re.compile(r"UID\s+(\d+)")
+_FLAGS_RE = re.compile(r"FLAGS\s*\(([^)]*)\)")
+_SIZE_RE = re.compile(r"RFC822\.SIZE\s+(\d+)")
+_ANGLE_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+# IMAP system flag -> ParsedEmail boolean field
+_FLAG_FIELDS: dict[str, str] = {
+  r"\Seen": "is_read",
+  r"\Flagged": "is_flagged",
+  r"\Answered": "is_answered",
+  r"\Draft": "is_draft",
+}
+
 
 def parse_raw_email(raw: bytes, uid: int) -> ParsedEmail:
   """Parse a raw RFC822 email into a ParsedEmail."""
@@ -183,7 +199,7 @@ def parse_fetch_response(lines: list[Any], uids: list[int]) -> list[ParsedEmail]
     line_str = line.strip()
 
     # Extract UID
-    uid_match = re.search(r"UID\s+(\d+)", line_str)
+    uid_match = _UID_RE.search(line_str)
     if uid_match:
       if current_uid is not None:
         # Save previous message
@@ -209,12 +225,12 @@ def parse_fetch_response(lines: list[Any], uids: list[int]) -> list[ParsedEmail]
       current_in_reply_to = ""
 
     # Extract FLAGS
-    flags_match = re.search(r"FLAGS\s*\(([^)]*)\)", line_str)
+    flags_match = _FLAGS_RE.search(line_str)
     if flags_match:
       current_flags = flags_match.group(1).split()
 
     # Extract size
-    size_match = re.search(r"RFC822\.SIZE\s+(\d+)", line_str)
+    size_match = _SIZE_RE.search(line_str)
     if size_match:
       current_size = int(size_match.group(1))
 
@@ -251,7 +267,7 @@ def parse_full_message(lines: list[Any], uid: int) -> ParsedEmail | None:
     if isinstance(line, bytes):
       raw_bytes = line
     elif isinstance(line, str):
-      flags_match = re.search(r"FLAGS\s*\(([^)]*)\)", line)
+      flags_match = _FLAGS_RE.search(line)
       if flags_match:
         flags = flags_match.group(1).split()
 
@@ -260,10 +276,8 @@ def parse_full_message(lines: list[Any], uid: int) -> ParsedEmail | None:
 
   email_obj = parse_raw_email(raw_bytes, uid)
   # Apply flags
-  email_obj.is_read = r"\Seen" in flags
-  email_obj.is_flagged = r"\Flagged" in flags
-  email_obj.is_answered = r"\Answered" in flags
-  email_obj.is_draft = r"\Draft" in flags
+  for field, value in _flag_fields(flags).items():
+    setattr(email_obj, field, value)
 
   return email_obj
 
@@ -273,11 +287,38 @@ def parse_full_message(lines: list[Any], uid: int) -> ParsedEmail | None:
 # ---------------------------------------------------------------------------
 
 
+def _flag_fields(flags: list[str]) -> dict[str, bool]:
+  """Map IMAP flags onto ParsedEmail's boolean fields in one pass over the flags."""
+  fields = dict.fromkeys(_FLAG_FIELDS.values(), False)
+  for flag in flags:
+    field = _FLAG_FIELDS.get(flag)
+    if field is not None:
+      fields[field] = True
+  return fields
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_address(raw: str) -> tuple[str, str]:
+  """Cached parseaddr for a single-address header such as From."""
+  return email.utils.parseaddr(raw)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_addresses(raw: str) -> tuple[tuple[str, str], ...]:
+  """Split an address header into (name, addr) pairs.
+
+  Sync batches see the same From/To headers over and over (regular
+  correspondents, mailing lists), so the RFC 5322 parse is cached by the
+  raw header value. Callers build fresh EmailAddress models from the pairs.
+  """
+  return tuple((name, addr) for name, addr in email.utils.getaddresses([raw]) if addr)
+
+
 def _parse_address(raw: str) -> EmailAddress | None:
   """Parse a single email address."""
   if not raw:
     return None
-  name, addr = email.utils.parseaddr(raw)
+  name, addr = _split_address(str(raw))
   if not addr:
     return None
   return EmailAddress(
@@ -290,24 +331,17 @@ def _parse_address_list(raw: str) -> list[EmailAddress]:
   """Parse a comma-separated list of email addresses."""
   if not raw:
     return []
-  addrs = email.utils.getaddresses([raw])
-  result = []
-  for name, addr in addrs:
-    if addr:
-      result.append(
-        EmailAddress(
-          email=addr,
-          display_name=name if name else None,
-        )
-      )
-  return result
+  return [
+    EmailAddress(email=addr, display_name=name if name else None)
+    for name, addr in _split_addresses(str(raw))
+  ]
 
 
 def _parse_references(raw: str | None) -> list[str]:
   """Parse the References header into a list of Message-IDs."""
   if not raw:
     return []
-  return [r.strip() for r in re.findall(r"<[^>]+>", raw)]
+  return [r.strip() for r in _ANGLE_RE.findall(raw)]
 
 
 def _compute_thread_id(message_id: str, references: list[str]) -> str:
@@ -335,8 +369,8 @@ def _strip_html(html: str) -> str:
   """Simple HTML tag stripper for preview generation."""
   if not html:
     return ""
-  text = re.sub(r"<[^>]+>", "", html)
-  text = re.sub(r"\s+", " ", text)
+  text = _ANGLE_RE.sub("", html)
+  text = _SPACE_RE.sub(" ", text)
   return text.strip()
 
 
@@ -364,9 +398,6 @@ def _build_envelope_email(
     from_addr=from_addr,
     subject=subject,
     date=_parse_date(date_str) if date_str else 0,
-    is_read=r"\Seen" in flags,
-    is_flagged=r"\Flagged" in flags,
-    is_answered=r"\Answered" in flags,
-    is_draft=r"\Draft" in flags,
     raw_size=size,
+    **_flag_fields(flags),
   )
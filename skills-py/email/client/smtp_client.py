@@ -44,6 +44,18 @@ def is_configured() -> bool:
   return bool(_config.get("host") and _config.get("email"))
 
 
+async def _connect_smtp(host: str, port: int, email: str, password: str) -> aiosmtplib.SMTP:
+  """Open and authenticate an SMTP session (implicit TLS on 465, STARTTLS otherwise)."""
+  if port == 465:
+    smtp = aiosmtplib.SMTP(hostname=host, port=port, use_tls=True)
+  else:
+    smtp = aiosmtplib.SMTP(hostname=host, port=port, start_tls=True)
+
+  await smtp.connect()
+  await smtp.login(email, password)
+  return smtp
+
+
 async def send_email(
   to: list[str],
   subject: str,
@@ -96,24 +108,9 @@ async def send_email(
 
   # Connect and send
   try:
-    port = _config["port"]
-    use_tls = port == 465
-
-    if use_tls:
-      smtp = aiosmtplib.SMTP(
-        hostname=_config["host"],
-        port=port,
-        use_tls=True,
-      )
-    else:
-      smtp = aiosmtplib.SMTP(
-        hostname=_config["host"],
-        port=port,
-        start_tls=True,
-      )
-
-    await smtp.connect()
-    await smtp.login(_config["email"], _config["password"])
+    smtp = await _connect_smtp(
+      _config["host"], _config["port"], _config["email"], _config["password"]
+    )
     await smtp.send_message(msg, sender=from_addr, recipients=all_recipients)
     await smtp.quit()
 
@@ -132,23 +129,7 @@ async def test_smtp_connection(
 ) -> tuple[bool, str]:
   """Test SMTP connectivity. Returns (success, message)."""
   try:
-    use_tls = port == 465
-
-    if use_tls:
-      smtp = aiosmtplib.SMTP(
-        hostname=host,
-        port=port,
-        use_tls=True,
-      )
-    else:
-      smtp = aiosmtplib.SMTP(
-        hostname=host,
-        port=port,
-        start_tls=True,
-      )
-
-    await smtp.connect()
-    await smtp.login(email, password)
+    smtp = await _connect_smtp(host, port, email, password)
     await smtp.quit()
     return True, "SMTP connection successful"
   except aiosmtplib.SMTPAuthenticationError:
@@ -9,11 +9,13 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from ..helpers import dumps
 from ..state.types import EmailAddress, EmailAttachment, EmailContact, ParsedEmail
 
 if TYPE_CHECKING:
   import aiosqlite
 
+
 log = logging.getLogger("skill.email.db.queries")
 
 
@@ -22,16 +24,7 @@ log = logging.getLogger("skill.email.db.queries")
 # ---------------------------------------------------------------------------
 
 
-async def upsert_email(
-  db: aiosqlite.Connection,
-  account_id: str,
-  folder: str,
-  email: ParsedEmail,
-) -> None:
-  """Insert or update a cached email."""
-  now = time.time()
-  await db.execute(
-    """
+_UPSERT_EMAIL_SQL = """
         INSERT INTO emails (
             account_id, folder, uid, message_id_header, in_reply_to,
             references_header, thread_id, from_addr, from_name,
@@ -65,36 +58,48 @@ async def upsert_email(
             attachments_json = excluded.attachments_json,
             raw_size = excluded.raw_size,
             updated_at = excluded.updated_at
-        """,
-    (
-      account_id,
-      folder,
-      email.uid,
-      email.message_id,
-      email.in_reply_to,
-      json.dumps(email.references),
-      email.thread_id,
-      email.from_addr.email if email.from_addr else None,
-      email.from_addr.display_name if email.from_addr else None,
-      json.dumps([a.model_dump() for a in email.to_addrs]),
-      json.dumps([a.model_dump() for a in email.cc_addrs]),
-      email.subject,
-      email.date,
-      email.body_text,
-      email.body_html,
-      email.body_preview,
-      1 if email.body_text or email.body_html else 0,
-      int(email.is_read),
-      int(email.is_flagged),
-      int(email.is_answered),
-      int(email.is_draft),
-      int(email.has_attachments),
-      email.attachment_count,
-      json.dumps([a.model_dump() for a in email.attachments]),
-      email.raw_size,
-      now,
-    ),
+        """
+
+
+def _email_params(account_id: str, folder: str, email: ParsedEmail, now: float) -> tuple[Any, ...]:
+  return (
+    account_id,
+    folder,
+    email.uid,
+    email.message_id,
+    email.in_reply_to,
+    dumps(email.references),
+    email.thread_id,
+    email.from_addr.email if email.from_addr else None,
+    email.from_addr.display_name if email.from_addr else None,
+    dumps([a.model_dump() for a in email.to_addrs]),
+    dumps([a.model_dump() for a in email.cc_addrs]),
+    email.subject,
+    email.date,
+    email.body_text,
+    email.body_html,
+    email.body_preview,
+    1 if email.body_text or email.body_html else 0,
+    int(email.is_read),
+    int(email.is_flagged),
+    int(email.is_answered),
+    int(email.is_draft),
+    int(email.has_attachments),
+    email.attachment_count,
+    dumps([a.model_dump() for a in email.attachments]),
+    email.raw_size,
+    now,
   )
+
+
+async def upsert_email(
+  db: aiosqlite.Connection,
+  account_id: str,
+  folder: str,
+  email: ParsedEmail,
+) -> None:
+  """Insert or update a cached email."""
+  await db.execute(_UPSERT_EMAIL_SQL, _email_params(account_id, folder, email, time.time()))
   await db.commit()
 
 
@@ -104,9 +109,14 @@ async def upsert_emails_batch(
   folder: str,
   emails: list[ParsedEmail],
 ) -> None:
-  """Batch insert/update cached emails."""
-  for email in emails:
-    await upsert_email(db, account_id, folder, email)
+  """Batch insert/update cached emails in a single transaction."""
+  if not emails:
+    return
+  now = time.time()
+  await db.executemany(
+    _UPSERT_EMAIL_SQL, [_email_params(account_id, folder, email, now) for email in emails]
+  )
+  await db.commit()
 
 
 async def get_cached_email(
@@ -148,11 +158,24 @@ async def list_cached_emails(
   folder: str,
   limit: int = 50,
   offset: int = 0,
+  unread_only: bool = False,
+  since: float | None = None,
 ) -> list[ParsedEmail]:
-  """List cached emails in a folder, ordered by date DESC."""
+  """List cached emails in a folder, ordered by date DESC.
+
+  Optional filters are applied in SQL so LIMIT counts only matching rows.
+  """
+  where = "account_id = ? AND folder = ?"
+  params: list[Any] = [account_id, folder]
+  if unread_only:
+    where += " AND is_read = 0"
+  if since is not None:
+    where += " AND date >= ?"
+    params.append(since)
+  params.extend([limit, offset])
   cursor = await db.execute(
-    "SELECT * FROM emails WHERE account_id = ? AND folder = ? ORDER BY date DESC LIMIT ? OFFSET ?",
-    (account_id, folder, limit, offset),
+    f"SELECT * FROM emails WHERE {where} ORDER BY date DESC LIMIT ? OFFSET ?",
+    params,
   )
   rows = await cursor.fetchall()
   return [_row_to_parsed_email(r) for r in rows]
@@ -185,15 +208,20 @@ async def search_cached_emails(
   return [_row_to_parsed_email(r) for r in rows]
 
 
-async def get_thread_emails(
+async def get_thread_emails_for_uid(
   db: aiosqlite.Connection,
   account_id: str,
-  thread_id: str,
+  folder: str,
+  uid: int,
 ) -> list[ParsedEmail]:
-  """Get all emails in a thread."""
+  """Get all emails in the thread of a cached message, resolved in a single query."""
   cursor = await db.execute(
-    "SELECT * FROM emails WHERE account_id = ? AND thread_id = ? ORDER BY date ASC",
-    (account_id, thread_id),
+    """SELECT t.* FROM emails m
+           JOIN emails t ON t.account_id = m.account_id AND t.thread_id = m.thread_id
+           WHERE m.account_id = ? AND m.folder = ? AND m.uid = ?
+             AND m.thread_id IS NOT NULL AND m.thread_id != ''
+           ORDER BY t.date ASC""",
+    (account_id, folder, uid),
   )
   rows = await cursor.fetchall()
   return [_row_to_parsed_email(r) for r in rows]
@@ -233,6 +261,35 @@ async def count_unread(
   return row["cnt"] if row else 0
 
 
+async def count_unread_by_folder(
+  db: aiosqlite.Connection,
+  account_id: str,
+  folders: list[str],
+) -> dict[str, int]:
+  """Count unread emails for several folders with one grouped query."""
+  counts = dict.fromkeys(folders, 0)
+  if not folders:
+    return counts
+  placeholders = ", ".join("?" * len(folders))
+  cursor = await db.execute(
+    f"""SELECT folder, COUNT(*) as cnt FROM emails
+           WHERE account_id = ? AND is_read = 0 AND folder IN ({placeholders})
+           GROUP BY folder""",
+    (account_id, *folders),
+  )
+  for row in await cursor.fetchall():
+    counts[row["folder"]] = row["cnt"]
+  return counts
+
+
+_FLAG_COLUMNS = ("is_read", "is_flagged", "is_answered", "is_draft")
+_UPDATE_FLAGS_SQL = (
+  "UPDATE emails SET "
+  + ", ".join(f"{name} = COALESCE(?, {name})" for name in _FLAG_COLUMNS)
+  + ", updated_at = ? WHERE account_id = ? AND folder = ? AND uid = ?"
+)
+
+
 async def update_email_flags(
   db: aiosqlite.Connection,
   account_id: str,
@@ -240,22 +297,17 @@ async def update_email_flags(
   uid: int,
   **flags: bool,
 ) -> None:
-  """Update flag columns on a cached email."""
-  now = time.time()
-  sets = []
-  params: list[Any] = []
-  for flag_name, flag_val in flags.items():
-    if flag_name in ("is_read", "is_flagged", "is_answered", "is_draft"):
-      sets.append(f"{flag_name} = ?")
-      params.append(int(flag_val))
-  if not sets:
+  """Update flag columns on a cached email.
+
+  Always runs the same statement — unset flags bind NULL and keep their
+  current value — so SQLite reuses one prepared statement for every call.
+  """
+  values = [int(flags[name]) if name in flags else None for name in _FLAG_COLUMNS]
+  if all(v is None for v in values):
     return
-  sets.append("updated_at = ?")
-  params.append(now)
-  params.extend([account_id, folder, uid])
   await db.execute(
-    f"UPDATE emails SET {', '.join(sets)} WHERE account_id = ? AND folder = ? AND uid = ?",
-    params,
+    _UPDATE_FLAGS_SQL,
+    (*values, time.time(), account_id, folder, uid),
   )
   await db.commit()
 
@@ -318,6 +370,32 @@ async def upsert_contact(
   await db.commit()
 
 
+async def upsert_contacts_batch(
+  db: aiosqlite.Connection,
+  contacts: dict[str, tuple[str | None, int]],
+) -> None:
+  """Insert or update many contacts in one commit.
+
+  ``contacts`` maps email -> (display_name, times_seen) so callers can fold
+  repeated addresses from a fetch batch before touching the database.
+  """
+  if not contacts:
+    return
+  now = time.time()
+  await db.executemany(
+    """
+        INSERT INTO contacts (email, display_name, last_seen, message_count)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (email) DO UPDATE SET
+            display_name = COALESCE(excluded.display_name, contacts.display_name),
+            last_seen = excluded.last_seen,
+            message_count = contacts.message_count + excluded.message_count
+        """,
+    [(addr, name, now, count) for addr, (name, count) in contacts.items()],
+  )
+  await db.commit()
+
+
 async def search_contacts(
   db: aiosqlite.Connection,
   query: str,
@@ -441,7 +519,7 @@ async def upsert_folder(
       account_id,
       name,
       delimiter,
-      json.dumps(flags or []),
+      dumps(flags or []),
       total_messages,
       unseen_messages,
       uidvalidity,
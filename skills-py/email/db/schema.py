@@ -53,6 +53,9 @@ CREATE TABLE IF NOT EXISTS emails (
     PRIMARY KEY (account_id, folder, uid)
 );
 CREATE INDEX IF NOT EXISTS idx_emails_date ON emails(date DESC);
+-- Folder listings filter by (account_id, folder) and walk date DESC; this lets
+-- LIMIT stop early instead of sorting every cached message in the folder
+CREATE INDEX IF NOT EXISTS idx_emails_folder_date ON emails(account_id, folder, date DESC);
 CREATE INDEX IF NOT EXISTS idx_emails_thread ON emails(thread_id);
 CREATE INDEX IF NOT EXISTS idx_emails_msgid ON emails(message_id_header);
 CREATE INDEX IF NOT EXISTS idx_emails_from ON emails(from_addr);
@@ -91,4 +94,8 @@ CREATE INDEX IF NOT EXISTS idx_summaries_type_created ON summaries(summary_type,
 PRAGMA_SQL = """
 PRAGMA journal_mode=WAL;
 PRAGMA busy_timeout=5000;
+-- Under WAL, NORMAL only fsyncs at checkpoints; a crash can lose the last
+-- commits but never corrupts, and this DB is a cache rebuilt from the server
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
 """
@@ -19,7 +19,7 @@ from ..state import store
 from .queries import (
   clear_folder_cache,
   get_sync_state,
-  upsert_contact,
+  upsert_contacts_batch,
   upsert_emails_batch,
   upsert_folder,
   upsert_sync_state,
@@ -77,10 +77,22 @@ async def sync_folder(
       else:
         last_uid = sync_state["last_seen_uid"]
 
-    # Search for new messages
-    new_uids = await client.search_uids_since(last_uid + 1)
+    # Search for new messages. UIDNEXT is the next UID the server will assign,
+    # so when it has not moved past the highwater mark nothing new can exist
+    # and the UID SEARCH round-trip is skipped.
+    if uidnext and uidnext <= last_uid + 1:
+      new_uids = []
+    else:
+      new_uids = await client.search_uids_since(last_uid + 1)
     if not new_uids:
-      await upsert_sync_state(db, account_id, folder, uidvalidity, last_uid)
+      # Idle ticks would rewrite the same highwater mark; skip the commit
+      unchanged = (
+        sync_state is not None
+        and sync_state["uidvalidity"] == uidvalidity
+        and sync_state["last_seen_uid"] == last_uid
+      )
+      if not unchanged:
+        await upsert_sync_state(db, account_id, folder, uidvalidity, last_uid)
       return 0
 
     log.info("Found %d new messages in %s", len(new_uids), folder)
@@ -96,14 +108,16 @@ async def sync_folder(
         await upsert_emails_batch(db, account_id, folder, emails)
         total_fetched += len(emails)
 
-        # Extract contacts
+        # Extract contacts, folding repeat senders/recipients within the batch
+        contacts: dict[str, tuple[str | None, int]] = {}
         for email in emails:
-          if email.from_addr:
-            await upsert_contact(db, email.from_addr.email, email.from_addr.display_name)
-          for addr in email.to_addrs:
-            await upsert_contact(db, addr.email, addr.display_name)
-          for addr in email.cc_addrs:
-            await upsert_contact(db, addr.email, addr.display_name)
+          addrs = [email.from_addr] if email.from_addr else []
+          addrs.extend(email.to_addrs)
+          addrs.extend(email.cc_addrs)
+          for addr in addrs:
+            prev_name, count = contacts.get(addr.email, (None, 0))
+            contacts[addr.email] = (addr.display_name or prev_name, count + 1)
+        await upsert_contacts_batch(db, contacts)
 
       batch_max = max(batch) if batch else 0
       if batch_max > max_uid:
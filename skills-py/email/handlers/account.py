@@ -4,18 +4,29 @@ Account info and status tool handlers.
 
 from __future__ import annotations
 
-from datetime import UTC
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..api import folder_api, message_api
 from ..client.imap_client import get_imap_client
 from ..client.smtp_client import is_configured as smtp_is_configured
 from ..db.connection import get_db
 from ..db.queries import search_contacts as db_search_contacts
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error
+from ..helpers import ErrorCategory, ToolResult, format_iso_timestamp, log_and_format_error
 from ..state import store
 from ..validation import opt_number, opt_string_list, req_string
 
+if TYPE_CHECKING:
+  from ..state.types import EmailContact
+
+__all__ = [
+  "get_account_info",
+  "get_mailbox_summary",
+  "get_unread_count",
+  "test_connection",
+  "get_sync_status",
+  "search_contacts",
+]
+
 
 async def get_account_info(args: dict[str, Any]) -> ToolResult:
   try:
@@ -72,13 +83,9 @@ async def get_unread_count(args: dict[str, Any]) -> ToolResult:
     folders = opt_string_list(args, "folders")
 
     if folders:
-      lines = []
-      total = 0
-      for folder in folders:
-        count = await message_api.get_unread_count(folder)
-        total += count
-        lines.append(f"{folder}: {count} unread")
-      lines.append(f"Total: {total} unread")
+      counts = await message_api.get_unread_counts(folders)
+      lines = [f"{folder}: {counts[folder]} unread" for folder in folders]
+      lines.append(f"Total: {sum(counts.values())} unread")
       return ToolResult(content="\n".join(lines))
     else:
       count = await message_api.get_unread_count()
@@ -94,7 +101,7 @@ async def test_connection(args: dict[str, Any]) -> ToolResult:
     # Test IMAP
     client = get_imap_client()
     if client:
-      imap_ok = await client.ensure_connected()
+      imap_ok = await client.ensure_connected(fresh=True)
       lines.append(f"IMAP: {'Connected' if imap_ok else 'Disconnected'}")
     else:
       lines.append("IMAP: Not configured")
@@ -119,10 +126,7 @@ async def get_sync_status(args: dict[str, Any]) -> ToolResult:
       f"Syncing: {state.is_syncing}",
     ]
     if state.last_sync:
-      from datetime import datetime
-
-      last = datetime.fromtimestamp(state.last_sync, tz=UTC).isoformat()
-      lines.append(f"Last sync: {last}")
+      lines.append(f"Last sync: {format_iso_timestamp(state.last_sync)}")
     else:
       lines.append("Last sync: Never")
 
@@ -143,12 +147,14 @@ async def search_contacts(args: dict[str, Any]) -> ToolResult:
     if not contacts:
       return ToolResult(content="No contacts match the search.")
 
-    lines = []
-    for c in contacts:
-      name = f"{c.display_name} " if c.display_name else ""
-      lines.append(f"{name}<{c.email}> ({c.message_count} messages)")
-
     header = f"Contacts matching '{query}' ({len(contacts)}):\n"
-    return ToolResult(content=header + "\n".join(lines))
+    return ToolResult(content=header + "\n".join(map(_contact_line, contacts)))
   except Exception as e:
     return log_and_format_error("search_contacts", e, ErrorCategory.SEARCH)
+
+
+def _contact_line(c: EmailContact) -> str:
+  """Format one contact as "Name <addr> (N messages)"."""
+  if c.display_name:
+    return f"{c.display_name} <{c.email}> ({c.message_count} messages)"
+  return f"<{c.email}> ({c.message_count} messages)"
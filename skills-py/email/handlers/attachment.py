@@ -7,13 +7,19 @@ from __future__ import annotations
 from typing import Any
 
 from ..api import attachment_api
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error
-from ..validation import opt_number, opt_string, validate_uid
+from ..helpers import ErrorCategory, ToolResult, format_size, log_and_format_error
+from ..validation import opt_number, opt_string, req_uid
+
+__all__ = [
+  "list_attachments",
+  "get_attachment_info",
+  "save_attachment",
+]
 
 
 async def list_attachments(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     folder = opt_string(args, "folder") or "INBOX"
 
     attachments = await attachment_api.list_attachments(uid, folder)
@@ -22,7 +28,7 @@ async def list_attachments(args: dict[str, Any]) -> ToolResult:
 
     lines = []
     for att in attachments:
-      size_str = _format_size(att.size)
+      size_str = format_size(att.size)
       lines.append(f"[{att.index}] {att.filename} ({att.content_type}, {size_str})")
 
     header = f"Attachments on message UID {uid} ({len(attachments)}):\n"
@@ -33,7 +39,7 @@ async def list_attachments(args: dict[str, Any]) -> ToolResult:
 
 async def get_attachment_info(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     index = opt_number(args, "attachment_index", 0)
     folder = opt_string(args, "folder") or "INBOX"
 
@@ -47,7 +53,7 @@ async def get_attachment_info(args: dict[str, Any]) -> ToolResult:
     lines = [
       f"Filename: {att.filename}",
       f"Content-Type: {att.content_type}",
-      f"Size: {_format_size(att.size)}",
+      f"Size: {format_size(att.size)}",
       f"Index: {att.index}",
     ]
     return ToolResult(content="\n".join(lines))
@@ -57,7 +63,7 @@ async def get_attachment_info(args: dict[str, Any]) -> ToolResult:
 
 async def save_attachment(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     index = opt_number(args, "attachment_index", 0)
     folder = opt_string(args, "folder") or "INBOX"
     filename = opt_string(args, "filename")
@@ -68,11 +74,3 @@ async def save_attachment(args: dict[str, Any]) -> ToolResult:
     return ToolResult(content="Failed to save attachment.", is_error=True)
   except Exception as e:
     return log_and_format_error("save_attachment", e, ErrorCategory.ATTACH)
-
-
-def _format_size(size: int) -> str:
-  if size < 1024:
-    return f"{size} B"
-  if size < 1024 * 1024:
-    return f"{size / 1024:.1f} KB"
-  return f"{size / (1024 * 1024):.1f} MB"
@@ -13,10 +13,17 @@ from ..validation import (
   opt_string,
   opt_string_list,
   req_string,
+  req_uid,
   validate_email_list,
-  validate_uid,
 )
 
+__all__ = [
+  "save_draft",
+  "list_drafts",
+  "update_draft",
+  "delete_draft",
+]
+
 
 async def save_draft(args: dict[str, Any]) -> ToolResult:
   try:
@@ -59,10 +66,9 @@ async def list_drafts(args: dict[str, Any]) -> ToolResult:
 
 async def update_draft(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
-    to = None
-    if args.get("to"):
-      to = validate_email_list(args.get("to"), "to")
+    uid = req_uid(args)
+    raw_to = args.get("to")
+    to = validate_email_list(raw_to, "to") if raw_to else None
     subject = opt_string(args, "subject")
     body = opt_string(args, "body")
     html_body = opt_string(args, "html_body")
@@ -83,7 +89,7 @@ async def update_draft(args: dict[str, Any]) -> ToolResult:
 
 async def delete_draft(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
 
     result = await draft_api.delete_draft(uid)
     if result:
@@ -4,76 +4,94 @@ Flag/manage tool handlers (mark read, flag, move, delete, archive).
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from ..api import flag_api
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_string, req_string, validate_uid_list
 
-
-async def mark_read(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.mark_read(uids, folder)
-    if result:
-      return ToolResult(content=f"Marked {len(uids)} message(s) as read.")
-    return ToolResult(content="Failed to mark messages as read.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("mark_read", e, ErrorCategory.FLAG)
-
-
-async def mark_unread(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.mark_unread(uids, folder)
-    if result:
-      return ToolResult(content=f"Marked {len(uids)} message(s) as unread.")
-    return ToolResult(content="Failed to mark messages as unread.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("mark_unread", e, ErrorCategory.FLAG)
-
-
-async def flag_message(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.flag_message(uids, folder)
-    if result:
-      return ToolResult(content=f"Flagged {len(uids)} message(s).")
-    return ToolResult(content="Failed to flag messages.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("flag_message", e, ErrorCategory.FLAG)
-
-
-async def unflag_message(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.unflag_message(uids, folder)
-    if result:
-      return ToolResult(content=f"Unflagged {len(uids)} message(s).")
-    return ToolResult(content="Failed to unflag messages.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("unflag_message", e, ErrorCategory.FLAG)
-
-
-async def delete_message(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.delete_message(uids, folder)
-    if result:
-      return ToolResult(content=f"Deleted {len(uids)} message(s) from {folder}.")
-    return ToolResult(content="Failed to delete messages.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("delete_message", e, ErrorCategory.FLAG)
+__all__ = [
+  "mark_read",
+  "mark_unread",
+  "flag_message",
+  "unflag_message",
+  "delete_message",
+  "move_message",
+  "archive_message",
+]
+
+
+def _make_flag_action(
+  name: str,
+  api_fn: Callable[[list[int], str], Awaitable[bool]],
+  done: str,
+  failed: str,
+) -> Callable[[dict[str, Any]], Awaitable[ToolResult]]:
+  """Build a handler for a (message_ids, folder) flag operation.
+
+  ``done`` is formatted with ``count`` and ``folder``; ``failed`` is returned
+  as-is when the API reports failure. ToolResult is frozen, so success results
+  are cached per (count, folder) and shared between calls.
+  """
+  failed_result = ToolResult(content=failed, is_error=True)
+
+  @functools.lru_cache(maxsize=128)
+  def done_result(count: int, folder: str) -> ToolResult:
+    return ToolResult(content=done.format(count=count, folder=folder))
+
+  async def handler(args: dict[str, Any]) -> ToolResult:
+    try:
+      uids = validate_uid_list(args.get("message_ids"))
+      folder = opt_string(args, "folder") or "INBOX"
+
+      if await api_fn(uids, folder):
+        return done_result(len(uids), folder)
+      return failed_result
+    except Exception as e:
+      return log_and_format_error(name, e, ErrorCategory.FLAG)
+
+  handler.__name__ = handler.__qualname__ = name
+  return handler
+
+
+mark_read = _make_flag_action(
+  "mark_read",
+  flag_api.mark_read,
+  "Marked {count} message(s) as read.",
+  "Failed to mark messages as read.",
+)
+mark_unread = _make_flag_action(
+  "mark_unread",
+  flag_api.mark_unread,
+  "Marked {count} message(s) as unread.",
+  "Failed to mark messages as unread.",
+)
+flag_message = _make_flag_action(
+  "flag_message",
+  flag_api.flag_message,
+  "Flagged {count} message(s).",
+  "Failed to flag messages.",
+)
+unflag_message = _make_flag_action(
+  "unflag_message",
+  flag_api.unflag_message,
+  "Unflagged {count} message(s).",
+  "Failed to unflag messages.",
+)
+delete_message = _make_flag_action(
+  "delete_message",
+  flag_api.delete_message,
+  "Deleted {count} message(s) from {folder}.",
+  "Failed to delete messages.",
+)
+archive_message = _make_flag_action(
+  "archive_message",
+  flag_api.archive_message,
+  "Archived {count} message(s).",
+  "Failed to archive messages.",
+)
 
 
 async def move_message(args: dict[str, Any]) -> ToolResult:
@@ -88,16 +106,3 @@ async def move_message(args: dict[str, Any]) -> ToolResult:
     return ToolResult(content="Failed to move messages.", is_error=True)
   except Exception as e:
     return log_and_format_error("move_message", e, ErrorCategory.FLAG)
-
-
-async def archive_message(args: dict[str, Any]) -> ToolResult:
-  try:
-    uids = validate_uid_list(args.get("message_ids"))
-    folder = opt_string(args, "folder") or "INBOX"
-
-    result = await flag_api.archive_message(uids, folder)
-    if result:
-      return ToolResult(content=f"Archived {len(uids)} message(s).")
-    return ToolResult(content="Failed to archive messages.", is_error=True)
-  except Exception as e:
-    return log_and_format_error("archive_message", e, ErrorCategory.FLAG)
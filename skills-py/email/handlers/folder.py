@@ -10,6 +10,14 @@ from ..api import folder_api
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_string, req_string
 
+__all__ = [
+  "list_folders",
+  "get_folder_status",
+  "create_folder",
+  "rename_folder",
+  "delete_folder",
+]
+
 
 async def list_folders(args: dict[str, Any]) -> ToolResult:
   try:
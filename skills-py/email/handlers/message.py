@@ -14,7 +14,17 @@ from ..helpers import (
   format_email_summary,
   log_and_format_error,
 )
-from ..validation import opt_number, opt_string, validate_uid
+from ..validation import opt_number, opt_string, opt_typed, req_uid
+
+__all__ = [
+  "list_messages",
+  "get_message",
+  "search_messages",
+  "get_unread_messages",
+  "get_thread",
+  "count_messages",
+  "get_recent_messages",
+]
 
 
 async def list_messages(args: dict[str, Any]) -> ToolResult:
@@ -36,7 +46,7 @@ async def list_messages(args: dict[str, Any]) -> ToolResult:
 
 async def get_message(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     folder = opt_string(args, "folder") or "INBOX"
     fmt = opt_string(args, "format") or "text"
 
@@ -59,9 +69,7 @@ async def search_messages(args: dict[str, Any]) -> ToolResult:
     subject = opt_string(args, "subject")
     since = opt_string(args, "since")
     before = opt_string(args, "before")
-    has_attachment = (
-      args.get("has_attachment") if isinstance(args.get("has_attachment"), bool) else None
-    )
+    has_attachment = opt_typed(args, "has_attachment", bool)
 
     messages = await message_api.search_messages(
       query,
@@ -102,7 +110,7 @@ async def get_unread_messages(args: dict[str, Any]) -> ToolResult:
 
 async def get_thread(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     folder = opt_string(args, "folder") or "INBOX"
 
     messages = await message_api.get_thread(uid, folder)
@@ -13,10 +13,16 @@ from ..validation import (
   opt_string,
   opt_string_list,
   req_string,
+  req_uid,
   validate_email_list,
-  validate_uid,
 )
 
+__all__ = [
+  "send_email",
+  "reply_to_email",
+  "forward_email",
+]
+
 
 async def send_email(args: dict[str, Any]) -> ToolResult:
   try:
@@ -46,7 +52,7 @@ async def send_email(args: dict[str, Any]) -> ToolResult:
 
 async def reply_to_email(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     body = req_string(args, "body")
     folder = opt_string(args, "folder") or "INBOX"
     reply_all = opt_boolean(args, "reply_all", False)
@@ -69,7 +75,7 @@ async def reply_to_email(args: dict[str, Any]) -> ToolResult:
 
 async def forward_email(args: dict[str, Any]) -> ToolResult:
   try:
-    uid = validate_uid(args.get("message_id"))
+    uid = req_uid(args)
     to = validate_email_list(args.get("to"), "to")
     folder = opt_string(args, "folder") or "INBOX"
     body = opt_string(args, "body")
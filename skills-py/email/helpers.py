@@ -4,18 +4,25 @@ Shared formatting and error handling helpers.
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import json
 import logging
-import time
-from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from enum import Enum
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any
+
+from .validation import ValidationError
 
 if TYPE_CHECKING:
   from .state.types import EmailAddress, EmailFolder, ParsedEmail
 
+try:
+  import orjson
+
+  ORJSON_AVAILABLE = True
+except ImportError:
+  ORJSON_AVAILABLE = False
+
 log = logging.getLogger("skill.email.helpers")
 
 
@@ -24,7 +31,7 @@ log = logging.getLogger("skill.email.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -40,9 +47,7 @@ def format_email_summary(email: ParsedEmail) -> str:
   from_str = ""
   if email.from_addr:
     from_str = email.from_addr.display_name or email.from_addr.email
-  date_str = ""
-  if email.date:
-    date_str = datetime.fromtimestamp(email.date, tz=UTC).strftime("%Y-%m-%d %H:%M")
+  date_str = _fmt_summary_minute(int(email.date // 60)) if email.date else ""
   read_flag = "" if email.is_read else "[UNREAD] "
   flag_flag = "[*] " if email.is_flagged else ""
   attach_flag = " [+att]" if email.has_attachments else ""
@@ -50,6 +55,17 @@ def format_email_summary(email: ParsedEmail) -> str:
   return f"{read_flag}{flag_flag}UID:{email.uid} | {date_str} | From: {from_str} | Subject: {email.subject}{attach_flag}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _fmt_summary_minute(minute: int) -> str:
+  """Format a Unix minute for summary lines; listings repeat the same minutes often."""
+  return datetime.fromtimestamp(minute * 60, tz=UTC).strftime("%Y-%m-%d %H:%M")
+
+
+def format_iso_timestamp(ts: float) -> str:
+  """Format a Unix timestamp as an ISO-8601 UTC string."""
+  return datetime.fromtimestamp(ts, tz=UTC).isoformat()
+
+
 def format_email_detail(email: ParsedEmail) -> str:
   """Format a full email for display."""
   lines = []
@@ -68,7 +84,7 @@ def format_email_detail(email: ParsedEmail) -> str:
     lines.append(f"CC: {cc_str}")
   lines.append(f"Subject: {email.subject}")
   if email.date:
-    lines.append(f"Date: {datetime.fromtimestamp(email.date, tz=UTC).isoformat()}")
+    lines.append(f"Date: {format_iso_timestamp(email.date)}")
 
   flags = []
   if not email.is_read:
@@ -85,7 +101,7 @@ def format_email_detail(email: ParsedEmail) -> str:
   if email.has_attachments:
     lines.append(f"Attachments: {email.attachment_count}")
     for att in email.attachments:
-      size_str = _format_size(att.size)
+      size_str = format_size(att.size)
       lines.append(f"  [{att.index}] {att.filename} ({att.content_type}, {size_str})")
 
   if email.thread_id and email.thread_id != email.message_id:
@@ -113,7 +129,7 @@ def format_address(addr: EmailAddress) -> str:
   return addr.email
 
 
-def _format_size(size: int) -> str:
+def format_size(size: int) -> str:
   """Format byte size for display."""
   if size < 1024:
     return f"{size} B"
@@ -127,7 +143,7 @@ def _format_size(size: int) -> str:
 # ---------------------------------------------------------------------------
 
 
-class ErrorCategory(str, Enum):
+class ErrorCategory:
   FOLDER = "FOLDER"
   MSG = "MSG"
   SEND = "SEND"
@@ -144,16 +160,14 @@ class ErrorCategory(str, Enum):
 def log_and_format_error(
   function_name: str,
   error: Exception,
-  category: str | ErrorCategory | None = None,
+  category: str | None = None,
 ) -> ToolResult:
-  prefix = category.value if isinstance(category, ErrorCategory) else (category or "GEN")
+  prefix = category or "GEN"
   hash_val = sum(ord(c) for c in function_name) % 1000
   error_code = f"{prefix}-ERR-{hash_val:03d}"
 
   log.error("[MCP] Error in %s - Code: %s - %s", function_name, error_code, error)
 
-  from .validation import ValidationError
-
   if isinstance(error, ValidationError):
     user_message = str(error)
   else:
@@ -163,51 +177,16 @@ def log_and_format_error(
 
 
 # ---------------------------------------------------------------------------
-# Rate limiter
+# JSON
 # ---------------------------------------------------------------------------
 
-ToolTier = Literal["state_only", "api_read", "api_write"]
-
-_RATE_LIMIT = {
-  "API_READ_DELAY_MS": 500,
-  "API_WRITE_DELAY_MS": 1000,
-  "MAX_CALLS_PER_MINUTE": 30,
-}
-
-_last_call_time: float = 0
-_call_history: deque[float] = deque()
-
-
-def _purge_old(now_ms: float) -> None:
-  cutoff = now_ms - 60_000
-  while _call_history and _call_history[0] < cutoff:
-    _call_history.popleft()
-
-
-async def enforce_rate_limit(tier: ToolTier) -> None:
-  global _last_call_time
-
-  if tier == "state_only":
-    return
-
-  now_ms = time.time() * 1000
-  _purge_old(now_ms)
-
-  if len(_call_history) >= _RATE_LIMIT["MAX_CALLS_PER_MINUTE"]:
-    oldest = _call_history[0]
-    wait_ms = oldest + 60_000 - now_ms + 50
-    if wait_ms > 0:
-      await asyncio.sleep(wait_ms / 1000)
-    _purge_old(time.time() * 1000)
-
-  required_delay = (
-    _RATE_LIMIT["API_WRITE_DELAY_MS"] if tier == "api_write" else _RATE_LIMIT["API_READ_DELAY_MS"]
-  )
-
-  now_ms = time.time() * 1000
-  elapsed = now_ms - _last_call_time
-  if elapsed < required_delay:
-    await asyncio.sleep((required_delay - elapsed) / 1000)
 
-  _last_call_time = time.time() * 1000
-  _call_history.append(_last_call_time)
+def dumps(obj: Any) -> str:
+  """Serialize to compact JSON text, via orjson when installed."""
+  if ORJSON_AVAILABLE:
+    try:
+      return orjson.dumps(obj).decode()
+    except TypeError:
+      # orjson rejects non-str keys and >64-bit ints; stdlib handles both
+      pass
+  return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
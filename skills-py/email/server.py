@@ -21,7 +21,7 @@ from .db.connection import close_db, get_db, init_db
 from .db.sync import refresh_folder_list, sync_all_watched_folders
 from .handlers import dispatch_tool
 from .state import store
-from .state.sync import init_host_sync
+from .state.sync import init_host_sync, stop_host_sync
 from .state.types import EmailAccount
 from .tools import ALL_TOOLS
 
@@ -103,8 +103,9 @@ async def on_skill_load(
   try:
     connected = await imap_client.connect(email_addr, password)
     if connected:
-      store.set_connection_status("connected")
-      store.set_is_initialized(True)
+      with store.batch():
+        store.set_connection_status("connected")
+        store.set_is_initialized(True)
 
       # Refresh folder list
       db = await get_db()
@@ -114,8 +115,9 @@ async def on_skill_load(
       await sync_all_watched_folders(db, email_addr)
       store.set_last_sync(time.time())
     else:
-      store.set_connection_status("error")
-      store.set_connection_error("IMAP connection failed")
+      with store.batch():
+        store.set_connection_status("error")
+        store.set_connection_error("IMAP connection failed")
   except Exception:
     log.exception("Failed to connect IMAP")
     store.set_connection_status("error")
@@ -132,6 +134,8 @@ async def on_skill_load(
 
 async def on_skill_unload() -> None:
   """Called when the host unloads this skill."""
+  await stop_host_sync()
+
   try:
     client = get_imap_client()
     if client:
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from dev.types.setup_types import (
@@ -36,26 +38,25 @@ log = logging.getLogger("skill.email.setup")
 # Module-level transient state (cleared on restart or cancel)
 # ---------------------------------------------------------------------------
 
-_provider: str = ""
-_imap_host: str = ""
-_imap_port: int = 993
-_smtp_host: str = ""
-_smtp_port: int = 587
-_use_ssl: bool = True
-_email: str = ""
-_password: str = ""
+
+@dataclass(slots=True)
+class _SetupState:
+  provider: str = ""
+  imap_host: str = ""
+  imap_port: int = 993
+  smtp_host: str = ""
+  smtp_port: int = 587
+  use_ssl: bool = True
+  email: str = ""
+  password: str = ""
+
+
+_state = _SetupState()
 
 
 def _reset_state() -> None:
-  global _provider, _imap_host, _imap_port, _smtp_host, _smtp_port, _use_ssl, _email, _password
-  _provider = ""
-  _imap_host = ""
-  _imap_port = 993
-  _smtp_host = ""
-  _smtp_port = 587
-  _use_ssl = True
-  _email = ""
-  _password = ""
+  global _state
+  _state = _SetupState()
 
 
 # ---------------------------------------------------------------------------
@@ -179,10 +180,9 @@ async def on_setup_start(ctx: Any) -> SetupStep:
 
 async def on_setup_submit(ctx: Any, step_id: str, values: dict[str, Any]) -> SetupResult:
   """Validate and process a submitted step."""
-  if step_id == "provider":
-    return await _handle_provider(ctx, values)
-  if step_id == "credentials":
-    return await _handle_credentials(ctx, values)
+  handler = _STEP_HANDLERS.get(step_id)
+  if handler is not None:
+    return await handler(ctx, values)
 
   return SetupResult(
     status="error",
@@ -201,7 +201,7 @@ async def on_setup_cancel(ctx: Any) -> None:
 
 
 async def _handle_provider(ctx: Any, values: dict[str, Any]) -> SetupResult:
-  global _provider, _imap_host, _imap_port, _smtp_host, _smtp_port
+  state = _state
 
   provider_id = str(values.get("provider", "")).strip().lower()
   if not provider_id:
@@ -210,31 +210,63 @@ async def _handle_provider(ctx: Any, values: dict[str, Any]) -> SetupResult:
       errors=[SetupFieldError(field="provider", message="Please select a provider")],
     )
 
-  _provider = provider_id
+  state.provider = provider_id
 
   # Pre-fill from preset
   preset = get_provider(provider_id)
   if preset:
-    _imap_host = preset.imap_host
-    _imap_port = preset.imap_port
-    _smtp_host = preset.smtp_host
-    _smtp_port = preset.smtp_port
+    state.imap_host = preset.imap_host
+    state.imap_port = preset.imap_port
+    state.smtp_host = preset.smtp_host
+    state.smtp_port = preset.smtp_port
 
   return SetupResult(
     status="next",
     next_step=_make_credentials_step(
       provider_id,
-      _imap_host,
-      _imap_port,
-      _smtp_host,
-      _smtp_port,
+      state.imap_host,
+      state.imap_port,
+      state.smtp_host,
+      state.smtp_port,
     ),
   )
 
 
-async def _handle_credentials(ctx: Any, values: dict[str, Any]) -> SetupResult:
-  global _imap_host, _imap_port, _smtp_host, _smtp_port, _use_ssl, _email, _password
+def _parse_port(
+  values: dict[str, Any],
+  key: str,
+  default: int,
+  label: str,
+  errors: list[SetupFieldError],
+) -> int:
+  """Parse a port field, recording a field error on bad input.
+
+  Number fields arrive as int or float (e.g. ``993.0``); strings are parsed
+  with a single int() call.
+  """
+  raw = values.get(key, default)
+  try:
+    if isinstance(raw, bool):
+      raise TypeError
+    if isinstance(raw, int):
+      port = raw
+    elif isinstance(raw, float):
+      if not raw.is_integer():
+        raise ValueError
+      port = int(raw)
+    elif isinstance(raw, str):
+      port = int(raw.strip())
+    else:
+      raise TypeError
+    if port <= 0:
+      raise ValueError
+  except (TypeError, ValueError):
+    errors.append(SetupFieldError(field=key, message=f"{label} port must be a positive number"))
+    return default
+  return port
 
+
+async def _handle_credentials(ctx: Any, values: dict[str, Any]) -> SetupResult:
   # Validate required fields
   errors: list[SetupFieldError] = []
 
@@ -254,20 +286,22 @@ async def _handle_credentials(ctx: Any, values: dict[str, Any]) -> SetupResult:
   if not password:
     errors.append(SetupFieldError(field="password", message="Password is required"))
 
+  imap_port = _parse_port(values, "imap_port", 993, "IMAP", errors)
+  smtp_port = _parse_port(values, "smtp_port", 587, "SMTP", errors)
+
   if errors:
     return SetupResult(status="error", errors=errors)
 
-  imap_port = int(values.get("imap_port", 993))
-  smtp_port = int(values.get("smtp_port", 587))
   use_ssl = bool(values.get("use_ssl", True))
 
-  _imap_host = imap_host
-  _imap_port = imap_port
-  _smtp_host = smtp_host
-  _smtp_port = smtp_port
-  _use_ssl = use_ssl
-  _email = email_addr
-  _password = password
+  state = _state
+  state.imap_host = imap_host
+  state.imap_port = imap_port
+  state.smtp_host = smtp_host
+  state.smtp_port = smtp_port
+  state.use_ssl = use_ssl
+  state.email = email_addr
+  state.password = password
 
   # Test IMAP connection
   try:
@@ -328,14 +362,14 @@ async def _handle_credentials(ctx: Any, values: dict[str, Any]) -> SetupResult:
 
   # Save config
   config = {
-    "provider": _provider,
-    "imap_host": _imap_host,
-    "imap_port": _imap_port,
-    "smtp_host": _smtp_host,
-    "smtp_port": _smtp_port,
-    "use_ssl": _use_ssl,
-    "email": _email,
-    "password": _password,
+    "provider": state.provider,
+    "imap_host": state.imap_host,
+    "imap_port": state.imap_port,
+    "smtp_host": state.smtp_host,
+    "smtp_port": state.smtp_port,
+    "use_ssl": state.use_ssl,
+    "email": state.email,
+    "password": state.password,
   }
 
   try:
@@ -351,12 +385,20 @@ async def _handle_credentials(ctx: Any, values: dict[str, Any]) -> SetupResult:
   )
 
 
+# step_id -> submit handler, built once the handlers above are defined
+_STEP_HANDLERS: dict[str, Callable[[Any, dict[str, Any]], Awaitable[SetupResult]]] = {
+  "provider": _handle_provider,
+  "credentials": _handle_credentials,
+}
+
+
+_PROVIDER_HINTS: dict[str, str] = {
+  "gmail": "Gmail requires an App Password (not your regular password)",
+  "yahoo": "Yahoo requires an App Password",
+  "icloud": "iCloud requires an App-Specific Password",
+}
+
+
 def _provider_hint() -> str:
   """Return a provider-specific hint for auth failures."""
-  if _provider == "gmail":
-    return "Gmail requires an App Password (not your regular password)"
-  if _provider == "yahoo":
-    return "Yahoo requires an App Password"
-  if _provider == "icloud":
-    return "iCloud requires an App-Specific Password"
-  return "check your email and password"
+  return _PROVIDER_HINTS.get(_state.provider, "check your email and password")
@@ -8,8 +8,10 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from dev.types.skill_types import (
@@ -23,7 +25,7 @@ from dev.types.skill_types import (
   ToolResult as SkillToolResult,
 )
 
-from .handlers import dispatch_tool
+from .handlers import DISPATCH, dispatch_tool
 from .setup import on_setup_cancel, on_setup_start, on_setup_submit
 from .tools import ALL_TOOLS
 
@@ -35,14 +37,20 @@ log = logging.getLogger("skill.email.skill")
 # ---------------------------------------------------------------------------
 
 
-def _make_execute(tool_name: str):
-  """Create an async execute function for a given tool name."""
+async def _execute(
+  handler: Callable[[dict[str, Any]], Awaitable[Any]], args: dict[str, Any]
+) -> SkillToolResult:
+  """Run a resolved tool handler and adapt the result for the host."""
+  result = await handler(args)
+  return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  async def execute(args: dict[str, Any]) -> SkillToolResult:
-    result = await dispatch_tool(tool_name, args)
-    return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  return execute
+def _make_execute(tool_name: str):
+  """Bind the shared execute coroutine to a tool's handler (no closure per tool)."""
+  # Resolve the handler once at registration instead of by name on every call;
+  # unknown names still go through dispatch_tool for its error result.
+  handler = DISPATCH.get(tool_name) or functools.partial(dispatch_tool, tool_name)
+  return functools.partial(_execute, handler)
 
 
 def _convert_tools() -> list[SkillTool]:
@@ -1,7 +1,8 @@
 """
 In-process state store for the Email runtime skill.
 
-State mutations are synchronous. After each mutation, listeners are notified.
+State mutations are synchronous and happen in place on a single EmailState;
+after each mutation, listeners are notified.
 """
 
 from __future__ import annotations
@@ -18,10 +19,13 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-  from collections.abc import Callable
+  from collections.abc import Callable, Iterator
 
 _state: EmailState = initial_state()
 _listeners: list[Callable[[], None]] = []
+# Nesting depth of batch() blocks, and whether a mutation happened inside one
+_batch_depth = 0
+_batch_dirty = False
 
 
 # ---------------------------------------------------------------------------
@@ -43,8 +47,32 @@ def subscribe(listener: Callable[[], None]) -> Callable[[], None]:
   return unsubscribe
 
 
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+  """Group several mutations so listeners are notified once, at the end."""
+  global _batch_depth, _batch_dirty
+  _batch_depth += 1
+  try:
+    yield
+  finally:
+    _batch_depth -= 1
+    if not _batch_depth and _batch_dirty:
+      _batch_dirty = False
+      _fire_listeners()
+
+
 def _notify() -> None:
-  for fn in _listeners:
+  global _batch_dirty
+  _state.version += 1
+  if _batch_depth:
+    _batch_dirty = True
+    return
+  _fire_listeners()
+
+
+def _fire_listeners() -> None:
+  # Iterate a snapshot so a listener may unsubscribe while being notified
+  for fn in tuple(_listeners):
     fn()
 
 
@@ -54,31 +82,26 @@ def _notify() -> None:
 
 
 def set_connection_status(status: EmailConnectionStatus) -> None:
-  global _state
-  _state = _state.model_copy(update={"connection_status": status})
+  _state.connection_status = status
   if status != "error":
-    _state = _state.model_copy(update={"connection_error": None})
+    _state.connection_error = None
   _notify()
 
 
 def set_connection_error(error: str | None) -> None:
-  global _state
-  updates: dict = {"connection_error": error}
+  _state.connection_error = error
   if error:
-    updates["connection_status"] = "error"
-  _state = _state.model_copy(update=updates)
+    _state.connection_status = "error"
   _notify()
 
 
 def set_is_initialized(value: bool) -> None:
-  global _state
-  _state = _state.model_copy(update={"is_initialized": value})
+  _state.is_initialized = value
   _notify()
 
 
 def set_account(account: EmailAccount | None) -> None:
-  global _state
-  _state = _state.model_copy(update={"account": account})
+  _state.account = account
   _notify()
 
 
@@ -88,17 +111,20 @@ def set_account(account: EmailAccount | None) -> None:
 
 
 def set_folders(folders: dict[str, EmailFolder]) -> None:
-  global _state
-  total_unread = sum(f.unseen_messages for f in folders.values())
-  _state = _state.model_copy(update={"folders": folders, "total_unread": total_unread})
+  # Periodic LIST refreshes usually return the same folders; skip the no-op notify
+  if folders == _state.folders:
+    return
+  _state.folders = folders
+  _state.total_unread = sum(f.unseen_messages for f in folders.values())
   _notify()
 
 
 def update_folder(name: str, folder: EmailFolder) -> None:
-  global _state
-  folders = {**_state.folders, name: folder}
-  total_unread = sum(f.unseen_messages for f in folders.values())
-  _state = _state.model_copy(update={"folders": folders, "total_unread": total_unread})
+  prev = _state.folders.get(name)
+  _state.folders[name] = folder
+  # Adjust the running total by this folder's delta instead of re-summing every folder
+  prev_unseen = prev.unseen_messages if prev else 0
+  _state.total_unread += folder.unseen_messages - prev_unseen
   _notify()
 
 
@@ -112,14 +138,12 @@ def get_folder(name: str) -> EmailFolder | None:
 
 
 def set_sync_status(is_syncing: bool) -> None:
-  global _state
-  _state = _state.model_copy(update={"is_syncing": is_syncing})
+  _state.is_syncing = is_syncing
   _notify()
 
 
 def set_last_sync(timestamp: float) -> None:
-  global _state
-  _state = _state.model_copy(update={"last_sync": timestamp})
+  _state.last_sync = timestamp
   _notify()
 
 
@@ -130,5 +154,8 @@ def set_last_sync(timestamp: float) -> None:
 
 def reset_state() -> None:
   global _state
+  # Carry the version over so a reset never looks like an already-seen state
+  version = _state.version
   _state = initial_state()
+  _state.version = version
   _notify()
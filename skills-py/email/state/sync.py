@@ -5,6 +5,8 @@ Push state summary to the host via reverse RPC.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import inspect
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -16,31 +18,71 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("skill.email.sync")
 
-_push_to_host: Callable[[dict[str, Any]], Awaitable[None]] | None = None
-_debounce_handle: asyncio.TimerHandle | None = None
+_push_to_host: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None
 DEBOUNCE_S = 0.1
 
+# Set by store listeners; one long-lived worker coalesces bursts into a push.
+# Both are created by init_host_sync on the running loop, never at import.
+_dirty: asyncio.Event | None = None
+_worker: asyncio.Task[None] | None = None
+_unsubscribe: Callable[[], None] | None = None
+
+# Last full summary pushed to the host; later pushes send only the keys that differ
+_last_pushed: dict[str, Any] | None = None
+# Store version that payload was built from; an unchanged store skips the rebuild
+_last_version: int = -1
+
 
 def init_host_sync(
-  set_state: Callable[[dict[str, Any]], Awaitable[None]],
+  set_state: Callable[[dict[str, Any]], Awaitable[None] | None],
 ) -> None:
   """Initialize the sync-to-host bridge."""
-  global _push_to_host
+  global _push_to_host, _last_pushed, _last_version, _worker, _dirty, _unsubscribe
   _push_to_host = set_state
+  _last_pushed = None
+  _last_version = -1
+
+  if _unsubscribe is None:
+    _unsubscribe = subscribe(_on_state_change)
+  loop = asyncio.get_running_loop()
+  if _worker is None or _worker.done() or _worker.get_loop() is not loop:
+    # A fresh Event per worker: an Event is bound to the loop it is first
+    # awaited on, so one left over from an earlier loop would kill the worker
+    _dirty = asyncio.Event()
+    _worker = loop.create_task(_sync_worker(_dirty))
+  else:
+    # Worker already running: have it send a full summary to the new sink
+    _dirty.set()
+
+
+async def stop_host_sync() -> None:
+  """Stop the sync worker and detach from the store."""
+  global _push_to_host, _worker, _dirty, _unsubscribe
+  if _unsubscribe is not None:
+    _unsubscribe()
+    _unsubscribe = None
+  worker, _worker = _worker, None
+  _dirty = None
+  _push_to_host = None
+  if worker is not None and not worker.done():
+    worker.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+      await worker
 
-  subscribe(_on_state_change)
 
-  # Push initial state
-  loop = asyncio.get_event_loop()
-  loop.call_soon(lambda: asyncio.ensure_future(_push_host_state()))
+def _on_state_change() -> None:
+  if _dirty is not None:
+    _dirty.set()
 
 
-def _on_state_change() -> None:
-  global _debounce_handle
-  loop = asyncio.get_event_loop()
-  if _debounce_handle is not None:
-    _debounce_handle.cancel()
-  _debounce_handle = loop.call_later(DEBOUNCE_S, lambda: asyncio.ensure_future(_push_host_state()))
+async def _sync_worker(dirty: asyncio.Event) -> None:
+  """Push the initial summary, then at most one push per DEBOUNCE_S while dirty."""
+  await _push_host_state()
+  while True:
+    await dirty.wait()
+    await asyncio.sleep(DEBOUNCE_S)
+    dirty.clear()
+    await _push_host_state()
 
 
 def _build_host_state() -> EmailHostState:
@@ -55,10 +97,28 @@ def _build_host_state() -> EmailHostState:
 
 
 async def _push_host_state() -> None:
+  global _last_pushed, _last_version
   if _push_to_host is None:
     return
+  version = get_state().version
+  if version == _last_version:
+    return
   try:
-    host_state = _build_host_state()
-    await _push_to_host(host_state.model_dump())
+    payload = _build_host_state().model_dump()
+    # set_state merges partial updates, so after the first full push only the
+    # changed keys are sent. Many mutations (sync flags, fields the host never
+    # sees) change none of them; skip the reverse RPC for those.
+    if _last_pushed is None:
+      changes = payload
+    else:
+      changes = {k: v for k, v in payload.items() if _last_pushed.get(k) != v}
+    if changes:
+      # The skill's set_state_fn is synchronous (ctx.set_state); only await
+      # callbacks that actually return an awaitable
+      result = _push_to_host(changes)
+      if inspect.isawaitable(result):
+        await result
+      _last_pushed = payload
+    _last_version = version
   except Exception:
     log.exception("Failed to push state to host")
@@ -7,6 +7,7 @@ is pushed to the host via reverse RPC for React UI consumption.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -87,8 +88,9 @@ class SyncState(BaseModel):
   last_full_sync: float = 0
 
 
-class EmailState(BaseModel):
-  """Full in-process state."""
+@dataclass(slots=True)
+class EmailState:
+  """Full in-process state, mutated in place by the store."""
 
   # Connection
   connection_status: EmailConnectionStatus = "disconnected"
@@ -97,13 +99,15 @@ class EmailState(BaseModel):
   # Account
   account: EmailAccount | None = None
   # Folders
-  folders: dict[str, EmailFolder] = Field(default_factory=dict)
+  folders: dict[str, EmailFolder] = field(default_factory=dict)
   # Sync
   is_syncing: bool = False
   last_sync: float = 0
-  sync_states: dict[str, SyncState] = Field(default_factory=dict)
+  sync_states: dict[str, SyncState] = field(default_factory=dict)
   # Stats
   total_unread: int = 0
+  # Bumped on every notify so readers can skip work when nothing changed
+  version: int = 0
 
 
 class EmailHostState(BaseModel):
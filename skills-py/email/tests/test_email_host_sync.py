@@ -0,0 +1,86 @@
+"""Host-sync bridge driven by the skill's real, synchronous set_state callback."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from skills.email.state import store, sync
+
+
+@pytest.fixture(autouse=True)
+def _no_debounce(monkeypatch: pytest.MonkeyPatch) -> None:
+  monkeypatch.setattr(sync, "DEBOUNCE_S", 0)
+  store.reset_state()
+
+
+def _start() -> asyncio.Queue[dict[str, Any]]:
+  """Start the bridge with a synchronous callback shaped like skill._on_load's."""
+  pushed: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+  def set_state_fn(partial: dict[str, Any]) -> None:
+    pushed.put_nowait(partial)
+
+  sync.init_host_sync(set_state_fn)
+  return pushed
+
+
+async def _next(pushed: asyncio.Queue[dict[str, Any]]) -> dict[str, Any]:
+  return await asyncio.wait_for(pushed.get(), timeout=5)
+
+
+def test_sync_set_state_pushes_diffs_and_records_version() -> None:
+  async def scenario() -> None:
+    pushed = _start()
+    try:
+      first = await _next(pushed)
+      assert first["connection_status"] == "disconnected"
+      assert sync._last_version == store.get_state().version
+
+      store.set_connection_status("connected")
+      assert await _next(pushed) == {"connection_status": "connected"}
+      assert sync._last_version == store.get_state().version
+    finally:
+      await sync.stop_host_sync()
+
+  asyncio.run(scenario())
+
+
+def test_identical_summary_is_not_pushed_again() -> None:
+  async def scenario() -> None:
+    pushed = _start()
+    try:
+      await _next(pushed)
+
+      # Bump the store version without changing the summary, then make a real
+      # change: only the real change may reach the host
+      store.set_connection_status("disconnected")
+      store.set_sync_status(True)
+      store.set_is_initialized(True)
+      assert await _next(pushed) == {"is_initialized": True}
+      assert pushed.empty()
+    finally:
+      await sync.stop_host_sync()
+
+  asyncio.run(scenario())
+
+
+def test_worker_survives_a_second_event_loop() -> None:
+  async def first() -> None:
+    await _next(_start())
+    # Loop ends without stop_host_sync; asyncio.run cancels the worker
+
+  async def second() -> None:
+    pushed = _start()
+    try:
+      await _next(pushed)
+      store.set_is_initialized(True)
+      assert await _next(pushed) == {"is_initialized": True}
+    finally:
+      await sync.stop_host_sync()
+    assert sync._worker is None
+
+  asyncio.run(first())
+  asyncio.run(second())
@@ -7,6 +7,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class ValidationError(Exception):
   pass
@@ -17,29 +19,36 @@ def validate_email_address(value: Any, param_name: str) -> str:
   if not isinstance(value, str) or not value:
     raise ValidationError(f"Missing required parameter: {param_name}")
   value = value.strip()
-  if not re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", value):
+  if not _EMAIL_RE.match(value):
     raise ValidationError(f"Invalid email address for {param_name}: {value}")
   # Type narrowing: value is guaranteed to be str at this point
   return str(value)
 
 
 def validate_email_list(value: Any, param_name: str) -> list[str]:
-  """Validate a list of email addresses or a comma-separated string."""
+  """Validate a list of email addresses or a comma-separated string.
+
+  Entries are stripped and checked in a single pass, so a bad address is
+  reported without normalising the rest of the input first.
+  """
   if isinstance(value, str):
-    parts = [p.strip() for p in value.split(",") if p.strip()]
+    parts = value.split(",")
   elif isinstance(value, list):
-    parts = [str(p).strip() for p in value if p]
+    parts = value
   else:
     raise ValidationError(f"Invalid {param_name}: must be a list or comma-separated string")
 
-  if not parts:
-    raise ValidationError(f"Missing required parameter: {param_name}")
-
   validated = []
-  for addr in parts:
-    if not re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", addr):
+  for p in parts:
+    addr = str(p).strip() if p else ""
+    if not addr:
+      continue
+    if not _EMAIL_RE.match(addr):
       raise ValidationError(f"Invalid email address in {param_name}: {addr}")
     validated.append(addr)
+
+  if not validated:
+    raise ValidationError(f"Missing required parameter: {param_name}")
   return validated
 
 
@@ -52,20 +61,17 @@ def validate_folder(value: Any, param_name: str = "folder") -> str:
 
 def validate_uid(value: Any, param_name: str = "message_id") -> int:
   """Validate a UID (positive integer)."""
+  uid = 0
   if isinstance(value, (int, float)):
     uid = int(value)
-    if uid <= 0:
-      raise ValidationError(f"Invalid {param_name}: must be a positive integer")
-    return uid
-  if isinstance(value, str):
+  elif isinstance(value, str):
     try:
       uid = int(value)
     except ValueError:
-      raise ValidationError(f"Invalid {param_name}: must be a positive integer")
-    if uid <= 0:
-      raise ValidationError(f"Invalid {param_name}: must be a positive integer")
-    return uid
-  raise ValidationError(f"Invalid {param_name}: must be a positive integer")
+      pass
+  if uid <= 0:
+    raise ValidationError(f"Invalid {param_name}: must be a positive integer")
+  return uid
 
 
 def validate_uid_list(value: Any, param_name: str = "message_ids") -> list[int]:
@@ -78,6 +84,8 @@ def validate_uid_list(value: Any, param_name: str = "message_ids") -> list[int]:
     except ValueError:
       raise ValidationError(f"Invalid {param_name}: must be an integer or list of integers")
   if isinstance(value, list):
+    if not value:
+      raise ValidationError(f"Missing required parameter: {param_name}")
     result = []
     for item in value:
       if isinstance(item, (int, float)):
@@ -89,12 +97,15 @@ def validate_uid_list(value: Any, param_name: str = "message_ids") -> list[int]:
           raise ValidationError(f"Invalid UID in {param_name}: {item}")
       else:
         raise ValidationError(f"Invalid UID in {param_name}: {item}")
-    if not result:
-      raise ValidationError(f"Missing required parameter: {param_name}")
     return result
   raise ValidationError(f"Invalid {param_name}: must be an integer or list of integers")
 
 
+def req_uid(args: dict[str, Any], key: str = "message_id") -> int:
+  """Read a required UID from args."""
+  return validate_uid(args.get(key), key)
+
+
 def opt_number(args: dict[str, Any], key: str, fallback: int) -> int:
   """Read an optional number from args with a fallback."""
   v = args.get(key)
@@ -123,13 +134,21 @@ def opt_boolean(args: dict[str, Any], key: str, fallback: bool = False) -> bool:
   return v if isinstance(v, bool) else fallback
 
 
+def opt_typed(
+  args: dict[str, Any], key: str, typ: type | tuple[type, ...], default: Any = None
+) -> Any:
+  """Read an optional value of the given type(s) from args, with one lookup."""
+  v = args.get(key)
+  return v if isinstance(v, typ) else default
+
+
 def opt_string_list(args: dict[str, Any], key: str) -> list[str] | None:
   """Read an optional list of strings from args."""
   v = args.get(key)
   if v is None:
     return None
   if isinstance(v, str):
-    return [p.strip() for p in v.split(",") if p.strip()]
+    return [p for p in map(str.strip, v.split(",")) if p]
   if isinstance(v, list):
     return [str(p).strip() for p in v if p]
   return None
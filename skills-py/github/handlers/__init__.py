@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
 from ..helpers import ToolResult
@@ -9,14 +10,16 @@ from ..helpers import ToolResult
 # Import all handler modules
 from . import actions, api, code, gist, issue, notification, pr, release, repo, search
 
-# Build dispatch table from handler modules
-DISPATCH: dict[str, Any] = {}
+# Build dispatch table from each handler module's explicit __all__
+_dispatch: dict[str, Any] = {}
 
 for mod in (repo, issue, pr, search, code, release, gist, actions, notification, api):
-  for name in dir(mod):
-    fn = getattr(mod, name)
-    if callable(fn) and not name.startswith("_"):
-      DISPATCH[name] = fn
+  for name in mod.__all__:
+    _dispatch[name] = getattr(mod, name)
+
+
+# Read-only view: the table is fixed once the handler modules are imported
+DISPATCH: MappingProxyType[str, Any] = MappingProxyType(_dispatch)
 
 
 async def dispatch_tool(name: str, arguments: dict[str, Any]) -> ToolResult:
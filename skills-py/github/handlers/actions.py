@@ -14,6 +14,18 @@ from ..validation import (
   validate_repo_spec,
 )
 
+__all__ = [
+  "list_workflows",
+  "list_workflow_runs",
+  "get_workflow_run",
+  "list_run_jobs",
+  "get_run_logs",
+  "rerun_workflow",
+  "cancel_workflow_run",
+  "trigger_workflow",
+  "view_workflow_yaml",
+]
+
 
 async def list_workflows(args: dict[str, Any]) -> ToolResult:
   try:
@@ -122,7 +134,7 @@ async def list_run_jobs(args: dict[str, Any]) -> ToolResult:
     for j in items:
       conclusion = j.conclusion or j.status or "in_progress"
       lines.append(f"{j.name} [{conclusion}]")
-      if hasattr(j, "steps") and j.steps:
+      if j.steps:
         for s in j.steps:
           step_status = s.conclusion or s.status or "?"
           lines.append(f"  - {s.name} [{step_status}]")
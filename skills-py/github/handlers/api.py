@@ -6,9 +6,13 @@ import json
 from typing import Any
 
 from ..client.gh_client import get_client, run_sync
-from ..helpers import ErrorCategory, ToolResult, log_and_format_error, truncate
+from ..helpers import ErrorCategory, ToolResult, dumps, log_and_format_error, truncate
 from ..validation import opt_string, req_string
 
+__all__ = [
+  "gh_api",
+]
+
 
 async def gh_api(args: dict[str, Any]) -> ToolResult:
   """Raw GitHub API call — fallback for anything not covered by other tools."""
@@ -56,6 +60,6 @@ async def gh_api(args: dict[str, Any]) -> ToolResult:
 
     if data is None:
       return ToolResult(content="(no content)")
-    return ToolResult(content=truncate(json.dumps(data, indent=2)))
+    return ToolResult(content=truncate(dumps(data, indent=True)))
   except Exception as e:
     return log_and_format_error("gh_api", e, ErrorCategory.API)
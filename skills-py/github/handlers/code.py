@@ -9,6 +9,12 @@ from ..client.gh_client import get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error, truncate
 from ..validation import opt_string, req_string, validate_repo_spec
 
+__all__ = [
+  "view_file",
+  "list_directory",
+  "get_readme",
+]
+
 
 async def view_file(args: dict[str, Any]) -> ToolResult:
   try:
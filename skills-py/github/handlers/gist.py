@@ -10,6 +10,15 @@ from ..client.gh_client import get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error, truncate
 from ..validation import opt_boolean, opt_number, opt_string, req_string
 
+__all__ = [
+  "list_gists",
+  "get_gist",
+  "create_gist",
+  "edit_gist",
+  "delete_gist",
+  "clone_gist",
+]
+
 
 async def list_gists(args: dict[str, Any]) -> ToolResult:
   try:
@@ -15,6 +15,24 @@ from ..validation import (
   validate_repo_spec,
 )
 
+__all__ = [
+  "list_issues",
+  "get_issue",
+  "create_issue",
+  "close_issue",
+  "reopen_issue",
+  "edit_issue",
+  "comment_on_issue",
+  "list_issue_comments",
+  "add_issue_labels",
+  "remove_issue_labels",
+  "add_issue_assignees",
+  "remove_issue_assignees",
+]
+
+# Upper bound on issues-endpoint items paged through when skipping PRs (10 pages)
+MAX_ISSUE_SCAN = 1000
+
 
 async def list_issues(args: dict[str, Any]) -> ToolResult:
   try:
@@ -31,17 +49,25 @@ async def list_issues(args: dict[str, Any]) -> ToolResult:
     if assignee:
       kwargs["assignee"] = assignee
     if label_filter:
-      labels = [await run_sync(repo.get_label, label_filter)]
-      kwargs["labels"] = labels
+      # The issues endpoint filters by label name; no need to resolve the Label first
+      kwargs["labels"] = [label_filter]
 
     issues = await run_sync(repo.get_issues, **kwargs)
-    # Filter out PRs (GitHub API returns PRs as issues too)
-    items = []
-    for issue in await run_sync(lambda: list(issues[: limit * 2])):
-      if issue.pull_request is None:
-        items.append(issue)
-      if len(items) >= limit:
-        break
+
+    def first_issues() -> list[Any]:
+      # GitHub returns PRs from the issues endpoint too; page lazily until
+      # `limit` real issues are found
+      found = []
+      for scanned, issue in enumerate(issues, 1):
+        if scanned > MAX_ISSUE_SCAN:
+          break
+        if issue.pull_request is None:
+          found.append(issue)
+          if len(found) >= limit:
+            break
+      return found
+
+    items = await run_sync(first_issues)
 
     if not items:
       return ToolResult(content=f"No {state} issues in {spec}.")
@@ -49,7 +75,8 @@ async def list_issues(args: dict[str, Any]) -> ToolResult:
     lines = []
     for i in items:
       labels = ", ".join(l.name for l in i.labels) if i.labels else ""
-      author = i.user.login if i.user else ""
+      user = i.user
+      author = user.login if user else ""
       state_str = i.state.upper()
       line = f"#{i.number} [{state_str}] {i.title[:80]}"
       if author:
@@ -210,7 +237,8 @@ async def list_issue_comments(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No comments on issue #{number}.")
     lines = []
     for c in items:
-      author = c.user.login if c.user else "unknown"
+      user = c.user
+      author = user.login if user else "unknown"
       body = (c.body or "")[:200]
       created = str(c.created_at)
       lines.append(f"@{author} ({created}):\n{body}\n")
@@ -8,6 +8,12 @@ from ..client.gh_client import get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_boolean, opt_number, req_string
 
+__all__ = [
+  "list_notifications",
+  "mark_notification_read",
+  "mark_all_notifications_read",
+]
+
 
 async def list_notifications(args: dict[str, Any]) -> ToolResult:
   try:
@@ -24,9 +30,11 @@ async def list_notifications(args: dict[str, Any]) -> ToolResult:
     lines = []
     for n in items:
       reason = n.reason or ""
-      repo_name = n.repository.full_name if n.repository else ""
-      title = n.subject.title if n.subject else ""
-      ntype = n.subject.type if n.subject else ""
+      repository = n.repository
+      repo_name = repository.full_name if repository else ""
+      subject = n.subject
+      title = subject.title if subject else ""
+      ntype = subject.type if subject else ""
       unread = "[unread]" if n.unread else "[read]"
       lines.append(f"{unread} [{repo_name}] {ntype}: {title} ({reason})")
     return ToolResult(content="\n".join(lines))
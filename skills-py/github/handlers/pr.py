@@ -16,6 +16,25 @@ from ..validation import (
   validate_repo_spec,
 )
 
+__all__ = [
+  "list_prs",
+  "get_pr",
+  "create_pr",
+  "close_pr",
+  "reopen_pr",
+  "merge_pr",
+  "edit_pr",
+  "comment_on_pr",
+  "list_pr_comments",
+  "list_pr_reviews",
+  "create_pr_review",
+  "list_pr_files",
+  "get_pr_diff",
+  "get_pr_checks",
+  "request_pr_reviewers",
+  "mark_pr_ready",
+]
+
 
 async def list_prs(args: dict[str, Any]) -> ToolResult:
   try:
@@ -38,7 +57,8 @@ async def list_prs(args: dict[str, Any]) -> ToolResult:
 
     lines = []
     for p in items:
-      author = p.user.login if p.user else ""
+      user = p.user
+      author = user.login if user else ""
       draft = " [draft]" if p.draft else ""
       labels = ", ".join(l.name for l in p.labels) if p.labels else ""
       line = f"#{p.number} [{p.state.upper()}] {p.title[:80]}"
@@ -229,7 +249,8 @@ async def list_pr_comments(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No comments on PR #{number}.")
     lines = []
     for c in items:
-      author = c.user.login if c.user else "unknown"
+      user = c.user
+      author = user.login if user else "unknown"
       body = (c.body or "")[:200]
       created = str(c.created_at)
       lines.append(f"@{author} ({created}):\n{body}\n")
@@ -253,7 +274,8 @@ async def list_pr_reviews(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No reviews on PR #{number}.")
     lines = []
     for r in items:
-      user = r.user.login if r.user else "unknown"
+      reviewer = r.user
+      user = reviewer.login if reviewer else "unknown"
       state = r.state or ""
       body = (r.body or "")[:150]
       lines.append(f"@{user}: {state}" + (f" - {body}" if body else ""))
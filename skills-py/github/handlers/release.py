@@ -14,6 +14,15 @@ from ..validation import (
   validate_repo_spec,
 )
 
+__all__ = [
+  "list_releases",
+  "get_release",
+  "create_release",
+  "delete_release",
+  "list_release_assets",
+  "get_latest_release",
+]
+
 
 async def list_releases(args: dict[str, Any]) -> ToolResult:
   try:
@@ -16,6 +16,21 @@ from ..validation import (
   validate_username,
 )
 
+__all__ = [
+  "list_repos",
+  "get_repo",
+  "create_repo",
+  "fork_repo",
+  "delete_repo",
+  "clone_repo",
+  "list_collaborators",
+  "add_collaborator",
+  "remove_collaborator",
+  "list_topics",
+  "set_topics",
+  "list_languages",
+]
+
 
 async def list_repos(args: dict[str, Any]) -> ToolResult:
   try:
@@ -171,14 +186,15 @@ async def list_collaborators(args: dict[str, Any]) -> ToolResult:
     lines = []
     for c in items:
       perms = []
-      if hasattr(c, "permissions") and c.permissions:
-        if c.permissions.admin:
+      permissions = c.permissions
+      if permissions:
+        if permissions.admin:
           perms.append("admin")
-        elif c.permissions.maintain:
+        elif permissions.maintain:
           perms.append("maintain")
-        elif c.permissions.push:
+        elif permissions.push:
           perms.append("push")
-        elif c.permissions.pull:
+        elif permissions.pull:
           perms.append("pull")
       perm_str = f" [{', '.join(perms)}]" if perms else ""
       lines.append(f"@{c.login}{perm_str}")
@@ -8,6 +8,13 @@ from ..client.gh_client import get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error
 from ..validation import opt_number, opt_string, req_string
 
+__all__ = [
+  "search_repos",
+  "search_issues",
+  "search_code",
+  "search_commits",
+]
+
 
 async def search_repos(args: dict[str, Any]) -> ToolResult:
   try:
@@ -52,8 +59,10 @@ async def search_issues(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No issues found for: {query}")
     lines = []
     for i in items:
-      repo_name = i.repository.full_name if i.repository else ""
-      author = i.user.login if i.user else ""
+      repository = i.repository
+      repo_name = repository.full_name if repository else ""
+      user = i.user
+      author = user.login if user else ""
       prefix = f"[{repo_name}] " if repo_name else ""
       line = f"{prefix}#{i.number} [{i.state.upper()}] {i.title[:80]}"
       if author:
@@ -86,7 +95,8 @@ async def search_code(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No code matches for: {query}")
     lines = []
     for c in items:
-      repo_name = c.repository.full_name if c.repository else ""
+      repository = c.repository
+      repo_name = repository.full_name if repository else ""
       lines.append(f"[{repo_name}] {c.path}")
     return ToolResult(content="\n".join(lines))
   except Exception as e:
@@ -112,9 +122,13 @@ async def search_commits(args: dict[str, Any]) -> ToolResult:
     lines = []
     for c in items:
       sha = c.sha[:7] if c.sha else "?"
-      msg = (c.commit.message or "").split("\n")[0][:80]
-      author = c.commit.author.name if c.commit.author else ""
-      repo_name = c.repository.full_name if hasattr(c, "repository") and c.repository else ""
+      commit = c.commit
+      msg = (commit.message or "").split("\n")[0][:80]
+      commit_author = commit.author
+      author = commit_author.name if commit_author else ""
+      # Commit.repository is missing on some PyGithub>=2.1.0 releases
+      repository = getattr(c, "repository", None)
+      repo_name = repository.full_name if repository else ""
       prefix = f"[{repo_name}] " if repo_name else ""
       lines.append(f"{prefix}{sha} {msg}" + (f" (by {author})" if author else ""))
     return ToolResult(content="\n".join(lines))
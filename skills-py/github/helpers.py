@@ -4,11 +4,20 @@ Shared formatting and error handling helpers for the GitHub skill.
 
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass
-from enum import Enum
 from typing import Any
 
+from .validation import ValidationError
+
+try:
+  import orjson
+
+  ORJSON_AVAILABLE = True
+except ImportError:
+  ORJSON_AVAILABLE = False
+
 log = logging.getLogger("skill.github.helpers")
 
 
@@ -17,7 +26,7 @@ log = logging.getLogger("skill.github.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -28,7 +37,7 @@ class ToolResult:
 # ---------------------------------------------------------------------------
 
 
-class ErrorCategory(str, Enum):
+class ErrorCategory:
   REPO = "REPO"
   ISSUE = "ISSUE"
   PR = "PR"
@@ -46,16 +55,14 @@ class ErrorCategory(str, Enum):
 def log_and_format_error(
   function_name: str,
   error: Exception,
-  category: str | ErrorCategory | None = None,
+  category: str | None = None,
 ) -> ToolResult:
-  prefix = category.value if isinstance(category, ErrorCategory) else (category or "GEN")
+  prefix = category or "GEN"
   hash_val = sum(ord(c) for c in function_name) % 1000
   error_code = f"{prefix}-ERR-{hash_val:03d}"
 
   log.error("[GH] Error in %s - Code: %s - %s", function_name, error_code, error)
 
-  from .validation import ValidationError
-
   if isinstance(error, ValidationError):
     user_message = str(error)
   else:
@@ -77,14 +84,14 @@ def format_repo_line(r: dict[str, Any]) -> str:
   vis = r.get("visibility", r.get("private", ""))
   if isinstance(vis, bool):
     vis = "private" if vis else "public"
-  parts = [name]
+  line = name
   if vis:
-    parts.append(f"[{vis}]")
+    line += f" [{vis}]"
   if stars != "":
-    parts.append(f"({stars} stars)")
+    line += f" ({stars} stars)"
   if desc:
-    parts.append(f"- {desc[:80]}")
-  return " ".join(parts)
+    line += f" - {desc[:80]}"
+  return line
 
 
 def format_issue_line(i: dict[str, Any]) -> str:
@@ -92,11 +99,10 @@ def format_issue_line(i: dict[str, Any]) -> str:
   number = i.get("number", "?")
   title = i.get("title", "")
   state = i.get("state", "")
-  author = ""
-  if isinstance(i.get("author"), dict):
-    author = i["author"].get("login", "")
-  elif isinstance(i.get("user"), dict):
-    author = i["user"].get("login", "")
+  owner = i.get("author")
+  if not isinstance(owner, dict):
+    owner = i.get("user")
+  author = owner.get("login", "") if isinstance(owner, dict) else ""
   labels = ""
   raw_labels = i.get("labels", [])
   if raw_labels:
@@ -104,12 +110,16 @@ def format_issue_line(i: dict[str, Any]) -> str:
       labels = ", ".join(l.get("name", "") for l in raw_labels[:3])
     elif isinstance(raw_labels[0], str):
       labels = ", ".join(raw_labels[:3])
-  parts = [f"#{number}", f"[{state}]" if state else "", title[:80]]
+  line = f"#{number}"
+  if state:
+    line += f" [{state}]"
+  if title:
+    line += f" {title[:80]}"
   if author:
-    parts.append(f"(by @{author})")
+    line += f" (by @{author})"
   if labels:
-    parts.append(f"[{labels}]")
-  return " ".join(p for p in parts if p)
+    line += f" [{labels}]"
+  return line
 
 
 def truncate(text: str, max_len: int = 4000) -> str:
@@ -117,3 +127,19 @@ def truncate(text: str, max_len: int = 4000) -> str:
   if len(text) <= max_len:
     return text
   return text[: max_len - 20] + "\n... (truncated)"
+
+
+# ---------------------------------------------------------------------------
+# JSON
+# ---------------------------------------------------------------------------
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+  """Serialize to JSON text (two-space indented if asked), via orjson when installed."""
+  if ORJSON_AVAILABLE:
+    try:
+      return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    except TypeError:
+      # orjson rejects non-str keys and >64-bit ints; stdlib handles both
+      pass
+  return json.dumps(obj, indent=2 if indent else None)
@@ -52,7 +52,7 @@ def opt_string_list(args: dict[str, Any], key: str) -> list[str]:
   if isinstance(v, list):
     return [str(item).strip() for item in v if item]
   if isinstance(v, str) and v.strip():
-    return [s.strip() for s in v.split(",") if s.strip()]
+    return [s for s in map(str.strip, v.split(",")) if s]
   return []
 
 
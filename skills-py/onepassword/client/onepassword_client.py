@@ -127,8 +127,9 @@ class OnePasswordClient:
 
     # Find the field
     fields = item.get("fields", [])
+    wanted = field_label.lower()
     for field in fields:
-      if field.get("label", "").lower() == field_label.lower():
+      if field.get("label", "").lower() == wanted:
         return field.get("value", "")
 
     raise ValueError(f"Field '{field_label}' not found in item")
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from enum import Enum
+
+from .validation import ValidationError
 
 log = logging.getLogger("skill.onepassword.helpers")
 
@@ -16,7 +17,7 @@ log = logging.getLogger("skill.onepassword.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -82,7 +83,7 @@ def format_item_detail(item: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
-class ErrorCategory(str, Enum):
+class ErrorCategory:
   ITEM = "ITEM"
   FIELD = "FIELD"
   AUTH = "AUTH"
@@ -93,16 +94,14 @@ class ErrorCategory(str, Enum):
 def log_and_format_error(
   function_name: str,
   error: Exception,
-  category: str | ErrorCategory | None = None,
+  category: str | None = None,
 ) -> ToolResult:
-  prefix = category.value if isinstance(category, ErrorCategory) else (category or "GEN")
+  prefix = category or "GEN"
   hash_val = sum(ord(c) for c in function_name) % 1000
   error_code = f"{prefix}-ERR-{hash_val:03d}"
 
   log.error("[1Password] Error in %s - Code: %s - %s", function_name, error_code, error)
 
-  from .validation import ValidationError
-
   if isinstance(error, ValidationError):
     user_message = str(error)
   else:
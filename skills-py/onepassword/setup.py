@@ -22,6 +22,7 @@ from dev.types.setup_types import (
 
 log = logging.getLogger("skill.onepassword.setup")
 
+
 # Module-level transient state
 _account: str = ""
 _vault: str = ""
@@ -8,6 +8,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from typing import Any
@@ -34,14 +35,15 @@ log = logging.getLogger("skill.onepassword.skill")
 # ---------------------------------------------------------------------------
 
 
-def _make_execute(tool_name: str):
-  """Create an async execute function for a given tool name."""
+async def _execute(tool_name: str, args: dict[str, Any]) -> SkillToolResult:
+  """Dispatch a tool call and adapt the result for the host."""
+  result = await dispatch_tool(tool_name, args)
+  return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  async def execute(args: dict[str, Any]) -> SkillToolResult:
-    result = await dispatch_tool(tool_name, args)
-    return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  return execute
+def _make_execute(tool_name: str):
+  """Bind the shared execute coroutine to a tool name (no closure per tool)."""
+  return functools.partial(_execute, tool_name)
 
 
 def _convert_tools() -> list[SkillTool]:
@@ -16,9 +16,8 @@ def opt_string(args: dict, key: str, default: str | None = None) -> str | None:
   val = args.get(key)
   if val is None:
     return default
-  if isinstance(val, str):
-    return val.strip() if val.strip() else default
-  return str(val).strip() if str(val).strip() else default
+  stripped = (val if isinstance(val, str) else str(val)).strip()
+  return stripped or default
 
 
 def opt_bool(args: dict, key: str, default: bool | None = None) -> bool | None:
@@ -5,23 +5,43 @@ between the HTTP client, state store, and database.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
+import sqlite3
 import time
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from ..db import queries
-from ..db.connection import get_db
+from ..db.connection import get_db, write_lock
 from ..helpers import enforce_rate_limit
 from ..state import store
 from ..state.types import OtterSpeaker, OtterSpeech, OtterTranscriptSegment, OtterUser
 
 if TYPE_CHECKING:
+  import aiosqlite
+
   from ..client.otter_client import OtterClient
 
 log = logging.getLogger("skill.otter.api.speech")
 
 _client: OtterClient | None = None
 
+# Errors a best-effort DB cache write may raise: sqlite failures, plus the
+# RuntimeError/ValueError raised for an uninitialized or closed connection
+_CACHE_ERRORS = (sqlite3.Error, RuntimeError, ValueError)
+
+# Cache writes dropped so far; API results are still returned when caching fails
+_cache_write_failures = 0
+
+# In-flight background cache writes (strong refs so tasks are not collected early)
+_pending_writes: set[asyncio.Task[None]] = set()
+
+# Cap on in-flight cache writes; beyond it new writes are shed rather than queued
+MAX_PENDING_CACHE_WRITES = 64
+
 
 def set_client(client: OtterClient) -> None:
   global _client
@@ -34,23 +54,123 @@ def get_client() -> OtterClient:
   return _client
 
 
+def _note_cache_failure(what: str) -> None:
+  """Count and log a dropped cache write (call from inside the except block)."""
+  global _cache_write_failures
+  _cache_write_failures += 1
+  log.debug("Failed to cache %s in DB (%d dropped)", what, _cache_write_failures, exc_info=True)
+
+
+def _cache_in_background(
+  what: str, write: Callable[[aiosqlite.Connection], Awaitable[None]]
+) -> None:
+  """Run a best-effort DB cache write without making the API caller wait on it.
+
+  The store is already updated by the time this is called, so readers see the
+  fresh data immediately; the SQLite write catches up on its own task.
+  If MAX_PENDING_CACHE_WRITES are already in flight the write is shed; the
+  next fetch of the same data rewrites it.
+  """
+  global _cache_write_failures
+  if len(_pending_writes) >= MAX_PENDING_CACHE_WRITES:
+    _cache_write_failures += 1
+    log.debug("Shedding %s cache write (%d dropped)", what, _cache_write_failures)
+    return
+
+  async def run() -> None:
+    try:
+      db = await get_db()
+      # One write transaction at a time; a failed one is rolled back so the
+      # next writer's commit() cannot pick up its partial statements
+      async with write_lock():
+        try:
+          await write(db)
+        except Exception:
+          with contextlib.suppress(Exception):
+            await db.rollback()
+          raise
+    except _CACHE_ERRORS:
+      _note_cache_failure(what)
+
+  task = asyncio.create_task(run())
+  _pending_writes.add(task)
+  task.add_done_callback(functools.partial(_on_write_done, what))
+
+
+def _on_write_done(what: str, task: asyncio.Task[None]) -> None:
+  """Forget a finished cache write and log any error it did not handle itself."""
+  _pending_writes.discard(task)
+  if task.cancelled():
+    return
+  exc = task.exception()
+  if exc is not None:
+    log.error("Background %s cache write failed", what, exc_info=exc)
+
+
+async def flush_cache_writes() -> None:
+  """Wait for in-flight cache writes. Call before closing the DB."""
+  if _pending_writes:
+    await asyncio.gather(*_pending_writes, return_exceptions=True)
+
+
+# ---------------------------------------------------------------------------
+# Response unwrapping
+# ---------------------------------------------------------------------------
+
+# Keys the API may wrap each list response in, tried in order
+_SPEECH_LIST_KEYS = ("speeches", "data")
+_SEARCH_RESULT_KEYS = ("speeches", "results")
+_TRANSCRIPT_KEYS = ("transcript", "segments")
+_SPEAKER_LIST_KEYS = ("speakers", "data")
+
+
+def _unwrap_list(result: Any, keys: tuple[str, ...]) -> list[Any] | None:
+  """Return the item list from a bare-list or keyed-dict response, or None."""
+  if isinstance(result, list):
+    return result
+  for key in keys:
+    if key in result:
+      value = result[key]
+      return value if isinstance(value, list) else None
+  return []
+
+
 # ---------------------------------------------------------------------------
 # Speech list
 # ---------------------------------------------------------------------------
 
 
+_MISSING = object()
+
+
+def _get_or(raw: dict[str, Any], key: str, alt: str, default: Any = None) -> Any:
+  """Return raw[key], falling back to raw[alt] only when key is absent.
+
+  Unlike ``raw.get(key, raw.get(alt))`` the fallback lookup is not evaluated
+  when the primary key is present, which is the common case per row.
+  """
+  v = raw.get(key, _MISSING)
+  return raw.get(alt, default) if v is _MISSING else v
+
+
 def _parse_speech(raw: dict[str, Any]) -> OtterSpeech:
   """Parse a raw API speech object into an OtterSpeech model."""
+  duration = raw.get("duration", _MISSING)
+  if duration is _MISSING:
+    duration = raw.get("end_time", 0) - raw.get("start_time", 0)
+  is_processed = raw.get("is_processed", _MISSING)
+  if is_processed is _MISSING:
+    is_processed = raw.get("status") == "done"
   return OtterSpeech(
-    speech_id=str(raw.get("id", raw.get("speech_id", ""))),
+    speech_id=str(_get_or(raw, "id", "speech_id", "")),
     title=raw.get("title", ""),
-    created_at=raw.get("created_at", raw.get("start_time", 0)),
-    duration=raw.get("duration", raw.get("end_time", 0) - raw.get("start_time", 0)),
+    created_at=_get_or(raw, "created_at", "start_time", 0),
+    duration=duration,
     summary=raw.get("summary"),
     speaker_count=raw.get("speaker_count", 0),
     word_count=raw.get("word_count", 0),
     folder_id=raw.get("folder_id"),
-    is_processed=raw.get("is_processed", raw.get("status") == "done"),
+    is_processed=is_processed,
     raw_json=raw,
   )
 
@@ -58,8 +178,8 @@ def _parse_speech(raw: dict[str, Any]) -> OtterSpeech:
 def _parse_speaker(raw: dict[str, Any]) -> OtterSpeaker:
   """Parse a raw API speaker object into an OtterSpeaker model."""
   return OtterSpeaker(
-    speaker_id=str(raw.get("id", raw.get("speaker_id", ""))),
-    name=raw.get("name", raw.get("display_name", "")),
+    speaker_id=str(_get_or(raw, "id", "speaker_id", "")),
+    name=_get_or(raw, "name", "display_name", ""),
   )
 
 
@@ -67,10 +187,10 @@ def _parse_transcript_segment(raw: dict[str, Any]) -> OtterTranscriptSegment:
   """Parse a raw API transcript segment."""
   return OtterTranscriptSegment(
     text=raw.get("text", ""),
-    start_offset=raw.get("start_offset", raw.get("start", 0)),
-    end_offset=raw.get("end_offset", raw.get("end", 0)),
+    start_offset=_get_or(raw, "start_offset", "start", 0),
+    end_offset=_get_or(raw, "end_offset", "end", 0),
     speaker_id=raw.get("speaker_id"),
-    speaker_name=raw.get("speaker_name", raw.get("speaker")),
+    speaker_name=_get_or(raw, "speaker_name", "speaker"),
   )
 
 
@@ -82,11 +202,7 @@ async def fetch_speeches(limit: int = 50, folder: str | None = None) -> list[Ott
   result = await client.get_speeches(limit=limit, folder=folder)
 
   # Handle both list and dict responses
-  raw_speeches = (
-    result if isinstance(result, list) else result.get("speeches", result.get("data", []))
-  )
-  if not isinstance(raw_speeches, list):
-    raw_speeches = []
+  raw_speeches = _unwrap_list(result, _SPEECH_LIST_KEYS) or []
 
   speeches = [_parse_speech(s) for s in raw_speeches]
 
@@ -96,11 +212,7 @@ async def fetch_speeches(limit: int = 50, folder: str | None = None) -> list[Ott
   store.set_speeches(speeches_dict, order)
 
   # Update DB
-  try:
-    db = await get_db()
-    await queries.upsert_speeches_batch(db, speeches)
-  except Exception:
-    log.debug("Failed to cache speeches in DB", exc_info=True)
+  _cache_in_background("speeches", lambda db: queries.upsert_speeches_batch(db, speeches))
 
   store.set_sync_status(last_sync=time.time())
   return speeches
@@ -118,12 +230,11 @@ async def fetch_speech(speech_id: str) -> OtterSpeech | None:
   speech = _parse_speech(raw)
   store.add_speech(speech)
 
-  try:
-    db = await get_db()
+  async def write(db: aiosqlite.Connection) -> None:
     await queries.upsert_speech(db, speech)
     await db.commit()
-  except Exception:
-    log.debug("Failed to cache speech in DB", exc_info=True)
+
+  _cache_in_background("speech", write)
 
   return speech
 
@@ -136,10 +247,8 @@ async def fetch_transcript(speech_id: str) -> list[OtterTranscriptSegment]:
   result = await client.get_transcript(speech_id)
 
   # Handle response format
-  raw_segments = (
-    result if isinstance(result, list) else result.get("transcript", result.get("segments", []))
-  )
-  if not isinstance(raw_segments, list):
+  raw_segments = _unwrap_list(result, _TRANSCRIPT_KEYS)
+  if raw_segments is None:
     # May be plain text
     text = result.get("text", "")
     if text:
@@ -149,11 +258,9 @@ async def fetch_transcript(speech_id: str) -> list[OtterTranscriptSegment]:
   segments = [_parse_transcript_segment(s) for s in raw_segments]
 
   # Cache in DB
-  try:
-    db = await get_db()
-    await queries.upsert_transcript_segments(db, speech_id, segments)
-  except Exception:
-    log.debug("Failed to cache transcript in DB", exc_info=True)
+  _cache_in_background(
+    "transcript", lambda db: queries.upsert_transcript_segments(db, speech_id, segments)
+  )
 
   return segments
 
@@ -168,9 +275,9 @@ async def fetch_user() -> OtterUser | None:
     return None
 
   user = OtterUser(
-    id=str(raw.get("id", raw.get("user_id", ""))),
+    id=str(_get_or(raw, "id", "user_id", "")),
     email=raw.get("email", ""),
-    name=raw.get("name", raw.get("display_name", "")),
+    name=_get_or(raw, "name", "display_name", ""),
   )
   store.set_current_user(user)
   return user
@@ -183,11 +290,7 @@ async def fetch_speakers() -> list[OtterSpeaker]:
 
   result = await client.get_speakers()
 
-  raw_speakers = (
-    result if isinstance(result, list) else result.get("speakers", result.get("data", []))
-  )
-  if not isinstance(raw_speakers, list):
-    raw_speakers = []
+  raw_speakers = _unwrap_list(result, _SPEAKER_LIST_KEYS) or []
 
   speakers = [_parse_speaker(s) for s in raw_speakers]
 
@@ -196,11 +299,7 @@ async def fetch_speakers() -> list[OtterSpeaker]:
   store.set_speakers(speakers_dict)
 
   # Cache in DB
-  try:
-    db = await get_db()
-    await queries.upsert_speakers_batch(db, speakers)
-  except Exception:
-    log.debug("Failed to cache speakers in DB", exc_info=True)
+  _cache_in_background("speakers", lambda db: queries.upsert_speakers_batch(db, speakers))
 
   return speakers
 
@@ -212,10 +311,6 @@ async def search_speeches(query: str, limit: int = 20) -> list[OtterSpeech]:
 
   result = await client.search_speeches(query, limit=limit)
 
-  raw_speeches = (
-    result if isinstance(result, list) else result.get("speeches", result.get("results", []))
-  )
-  if not isinstance(raw_speeches, list):
-    raw_speeches = []
+  raw_speeches = _unwrap_list(result, _SEARCH_RESULT_KEYS) or []
 
   return [_parse_speech(s) for s in raw_speeches]
@@ -4,16 +4,20 @@ Shared aiosqlite connection management.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 
 import aiosqlite
 
-from .schema import PRAGMA_SQL, SCHEMA_SQL
+from .schema import FTS_SQL, PRAGMA_SQL, SCHEMA_SQL
 
 log = logging.getLogger("skill.otter.db")
 
 _db: aiosqlite.Connection | None = None
+_has_fts: bool = False
+# Serializes write transactions from separate tasks on the shared connection
+_write_lock: asyncio.Lock | None = None
 
 
 async def get_db() -> aiosqlite.Connection:
@@ -26,13 +30,14 @@ async def get_db() -> aiosqlite.Connection:
 
 async def init_db(data_dir: str) -> aiosqlite.Connection:
   """Initialize the SQLite database."""
-  global _db
+  global _db, _write_lock
   os.makedirs(data_dir, exist_ok=True)
   db_path = os.path.join(data_dir, "otter.db")
   log.info("Opening database at %s", db_path)
 
   _db = await aiosqlite.connect(db_path)
   _db.row_factory = aiosqlite.Row
+  _write_lock = asyncio.Lock()
 
   # Set pragmas
   for line in PRAGMA_SQL.strip().splitlines():
@@ -42,16 +47,58 @@ async def init_db(data_dir: str) -> aiosqlite.Connection:
 
   # Create schema
   await _db.executescript(SCHEMA_SQL)
+  await _init_fts(_db)
   await _db.commit()
 
   log.info("Database initialized")
   return _db
 
 
+async def _init_fts(db: aiosqlite.Connection) -> None:
+  """Create the transcript trigram FTS5 index if this SQLite build supports it (3.34+)."""
+  global _has_fts
+  try:
+    cursor = await db.execute(
+      "SELECT sql FROM sqlite_master WHERE name = 'transcript_segments_fts'"
+    )
+    row = await cursor.fetchone()
+    if row is not None and "trigram" not in row[0]:
+      # Word-token index from an older version: substring search needs trigrams
+      await db.execute("DROP TABLE transcript_segments_fts")
+      row = None
+    await db.executescript(FTS_SQL)
+    if row is None:
+      # Index segments cached before the FTS table existed
+      await db.execute(
+        "INSERT INTO transcript_segments_fts(transcript_segments_fts) VALUES ('rebuild')"
+      )
+    _has_fts = True
+  except aiosqlite.OperationalError:
+    log.warning("FTS5 trigram index not available — transcript search will use instr() scans")
+    _has_fts = False
+
+
+def has_fts() -> bool:
+  """Whether the transcript full-text index is available."""
+  return _has_fts
+
+
+def write_lock() -> asyncio.Lock:
+  """Lock to hold around a write transaction run from its own task.
+
+  All tasks share one connection, so without it one task's commit() could
+  commit another task's half-finished statements.
+  """
+  if _write_lock is None:
+    raise RuntimeError("Database not initialized. Call init_db() first.")
+  return _write_lock
+
+
 async def close_db() -> None:
   """Close the database connection."""
-  global _db
+  global _db, _write_lock
   if _db is not None:
     await _db.close()
     _db = None
+    _write_lock = None
     log.info("Database closed")
@@ -4,16 +4,19 @@ Read/write query functions for the Otter.ai SQLite database.
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from ..helpers import dumps
+from .connection import has_fts
+
 if TYPE_CHECKING:
   import aiosqlite
 
   from ..state.types import OtterSpeaker, OtterSpeech, OtterTranscriptSegment
 
+
 log = logging.getLogger("skill.otter.db.queries")
 
 
@@ -38,7 +41,7 @@ async def upsert_speech(db: aiosqlite.Connection, speech: OtterSpeech) -> None:
       speech.word_count,
       speech.folder_id,
       int(speech.is_processed),
-      json.dumps(speech.raw_json) if speech.raw_json else None,
+      dumps(speech.raw_json) if speech.raw_json else None,
       time.time(),
     ),
   )
@@ -51,8 +54,9 @@ async def upsert_speeches_batch(db: aiosqlite.Connection, speeches: list[OtterSp
 
 
 async def get_all_speeches(db: aiosqlite.Connection, limit: int = 100) -> list[dict[str, Any]]:
-  cursor = await db.execute("SELECT * FROM speeches ORDER BY created_at DESC LIMIT ?", (limit,))
-  rows = await cursor.fetchall()
+  rows = await db.execute_fetchall(
+    "SELECT * FROM speeches ORDER BY created_at DESC LIMIT ?", (limit,)
+  )
   return [dict(row) for row in rows]
 
 
@@ -63,8 +67,7 @@ async def get_speech_by_id(db: aiosqlite.Connection, speech_id: str) -> dict[str
 
 
 async def get_speech_ids(db: aiosqlite.Connection) -> set[str]:
-  cursor = await db.execute("SELECT speech_id FROM speeches")
-  rows = await cursor.fetchall()
+  rows = await db.execute_fetchall("SELECT speech_id FROM speeches")
   return {row[0] for row in rows}
 
 
@@ -80,11 +83,11 @@ async def upsert_transcript_segments(
 ) -> None:
   # Clear existing segments for this speech
   await db.execute("DELETE FROM transcript_segments WHERE speech_id = ?", (speech_id,))
-  for i, seg in enumerate(segments):
-    await db.execute(
-      """INSERT INTO transcript_segments
-               (speech_id, text, start_offset, end_offset, speaker_id, speaker_name, segment_order)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+  await db.executemany(
+    """INSERT INTO transcript_segments
+           (speech_id, text, start_offset, end_offset, speaker_id, speaker_name, segment_order)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+    [
       (
         speech_id,
         seg.text,
@@ -93,46 +96,77 @@ async def upsert_transcript_segments(
         seg.speaker_id,
         seg.speaker_name,
         i,
-      ),
-    )
+      )
+      for i, seg in enumerate(segments)
+    ],
+  )
   await db.commit()
 
 
 async def get_transcript_segments(db: aiosqlite.Connection, speech_id: str) -> list[dict[str, Any]]:
-  cursor = await db.execute(
+  rows = await db.execute_fetchall(
     "SELECT * FROM transcript_segments WHERE speech_id = ? ORDER BY segment_order",
     (speech_id,),
   )
-  rows = await cursor.fetchall()
   return [dict(row) for row in rows]
 
 
 async def search_transcript_segments(
   db: aiosqlite.Connection, speech_id: str, query: str
 ) -> list[dict[str, Any]]:
-  cursor = await db.execute(
+  rows = await db.execute_fetchall(
     """SELECT * FROM transcript_segments
-           WHERE speech_id = ? AND text LIKE ?
+           WHERE speech_id = ? AND instr(lower(text), lower(?)) > 0
            ORDER BY segment_order""",
-    (speech_id, f"%{query}%"),
+    (speech_id, query),
   )
-  rows = await cursor.fetchall()
   return [dict(row) for row in rows]
 
 
+# The trigram index cannot match terms shorter than one trigram
+_FTS_MIN_QUERY_LEN = 3
+
+
+def _fts_phrase(query: str) -> str:
+  """Quote a user query as an FTS5 phrase so operators are not parsed."""
+  return '"' + query.replace('"', '""') + '"'
+
+
 async def search_all_transcripts(
-  db: aiosqlite.Connection, query: str, limit: int = 50
+  db: aiosqlite.Connection, query: str, limit: int = 50, per_speech: int | None = None
 ) -> list[dict[str, Any]]:
-  cursor = await db.execute(
-    """SELECT ts.*, s.title as speech_title
-           FROM transcript_segments ts
-           JOIN speeches s ON ts.speech_id = s.speech_id
-           WHERE ts.text LIKE ?
-           ORDER BY s.created_at DESC
+  """Search transcript text across all cached meetings, newest meetings first.
+
+  ``per_speech`` caps how many matching segments (in transcript order) each
+  meeting contributes, so callers that only show a few excerpts per meeting
+  don't pull the rest across the thread boundary.
+  """
+  # The trigram index matches substrings case-insensitively, like the instr()
+  # scan, so both paths return the same segments
+  if has_fts() and len(query) >= _FTS_MIN_QUERY_LEN:
+    source = "transcript_segments_fts f JOIN transcript_segments ts ON ts.id = f.rowid"
+    match = "f.text MATCH ?"
+    term = _fts_phrase(query)
+  else:
+    source = "transcript_segments ts"
+    match = "instr(lower(ts.text), lower(?)) > 0"
+    term = query
+
+  rows = await db.execute_fetchall(
+    f"""SELECT * FROM (
+             SELECT ts.*, s.title as speech_title, s.created_at as speech_created_at,
+                    ROW_NUMBER() OVER (
+                      PARTITION BY ts.speech_id ORDER BY ts.segment_order
+                    ) as speech_hit
+             FROM {source}
+             JOIN speeches s ON ts.speech_id = s.speech_id
+             WHERE {match}
+           )
+           WHERE speech_hit <= ?
+           ORDER BY speech_created_at DESC
            LIMIT ?""",
-    (f"%{query}%", limit),
+    (term, per_speech or limit, limit),
   )
-  rows = await cursor.fetchall()
   return [dict(row) for row in rows]
 
 
@@ -157,8 +191,7 @@ async def upsert_speakers_batch(db: aiosqlite.Connection, speakers: list[OtterSp
 
 
 async def get_all_speakers(db: aiosqlite.Connection) -> list[dict[str, Any]]:
-  cursor = await db.execute("SELECT * FROM speakers ORDER BY name")
-  rows = await cursor.fetchall()
+  rows = await db.execute_fetchall("SELECT * FROM speakers ORDER BY name")
   return [dict(row) for row in rows]
 
 
@@ -167,6 +200,10 @@ async def get_all_speakers(db: aiosqlite.Connection) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+SUMMARY_RETENTION_SECONDS = 604800  # 7 days, enforced by prune_old_data
+PRUNE_BATCH_SIZE = 5000
+
+
 async def insert_summary(
   db: aiosqlite.Connection,
   summary_type: str,
@@ -176,13 +213,24 @@ async def insert_summary(
 ) -> None:
   await db.execute(
     "INSERT INTO summaries (summary_type, content, period_start, period_end, created_at) VALUES (?, ?, ?, ?, ?)",
-    (summary_type, json.dumps(content), period_start, period_end, time.time()),
+    (summary_type, dumps(content), period_start, period_end, time.time()),
   )
   await db.commit()
 
 
 async def prune_old_data(db: aiosqlite.Connection) -> None:
-  """Remove old summaries (>7 days)."""
-  now = time.time()
-  await db.execute("DELETE FROM summaries WHERE created_at < ?", (now - 604800,))
-  await db.commit()
+  """Remove old summaries (>7 days).
+
+  Deletes in chunks of PRUNE_BATCH_SIZE, committing after each, so a large
+  backlog never holds the write lock for one long transaction.
+  """
+  cutoff = time.time() - SUMMARY_RETENTION_SECONDS
+  while True:
+    cursor = await db.execute(
+      """DELETE FROM summaries WHERE id IN
+             (SELECT id FROM summaries WHERE created_at < ? LIMIT ?)""",
+      (cutoff, PRUNE_BATCH_SIZE),
+    )
+    await db.commit()
+    if cursor.rowcount < PRUNE_BATCH_SIZE:
+      break
@@ -53,9 +53,37 @@ CREATE TABLE IF NOT EXISTS summaries (
     created_at REAL NOT NULL
 );
 CREATE INDEX IF NOT EXISTS idx_summaries_type_created ON summaries(summary_type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_summaries_created ON summaries(created_at);
+"""
+
+# Full-text index over transcript text. Kept separate from SCHEMA_SQL because
+# FTS5 is a compile-time SQLite option; init_db falls back to LIKE without it.
+FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS transcript_segments_fts USING fts5(
+    text,
+    content='transcript_segments',
+    content_rowid='id',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS transcript_segments_ai AFTER INSERT ON transcript_segments BEGIN
+    INSERT INTO transcript_segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcript_segments_ad AFTER DELETE ON transcript_segments BEGIN
+    INSERT INTO transcript_segments_fts(transcript_segments_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcript_segments_au AFTER UPDATE ON transcript_segments BEGIN
+    INSERT INTO transcript_segments_fts(transcript_segments_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+    INSERT INTO transcript_segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
 """
 
 PRAGMA_SQL = """
 PRAGMA journal_mode=WAL;
 PRAGMA busy_timeout=5000;
+-- Skip the per-commit fsync: with WAL a crash may drop the newest commits
+-- but cannot corrupt the file, and every table here is re-fetched or re-derived
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
 """
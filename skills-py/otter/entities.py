@@ -11,12 +11,13 @@ to the host runtime via reverse RPC.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from .db.connection import get_db
+from .helpers import format_timestamp
 from .state import store
 
 if TYPE_CHECKING:
@@ -29,6 +30,12 @@ SOURCE = "otter"
 UpsertEntityFn = Callable[..., Awaitable[None]]
 UpsertRelationshipFn = Callable[..., Awaitable[None]]
 
+# Cap on in-flight reverse-RPC upserts when emitting entities
+MAX_CONCURRENT_UPSERTS = 32
+
+# (speeches_order, speeches, speakers) as of the last emit_initial_entities run
+_last_emitted: tuple[Any, ...] | None = None
+
 
 def _meeting_metadata(speech: OtterSpeech) -> dict[str, Any]:
   """Build metadata dict for a meeting entity."""
@@ -45,65 +52,115 @@ def _meeting_metadata(speech: OtterSpeech) -> dict[str, Any]:
   return meta
 
 
+def _fmt_period(start: float, end: float) -> tuple[str, str]:
+  """Format a summary period, in local time, for entity titles."""
+  return (
+    format_timestamp(start, "%b %d %H:%M", utc=False),
+    format_timestamp(end, "%H:%M", utc=False),
+  )
+
+
+async def _gather_bounded(
+  calls: list[tuple[Callable[..., Awaitable[None]], dict[str, Any], str]],
+) -> list[bool]:
+  """Run (fn, kwargs, label) upserts concurrently, at most MAX_CONCURRENT_UPSERTS at once.
+
+  Failures are logged per call and never abort the rest of the batch.
+  Returns whether each call succeeded, in call order.
+  """
+  sem = asyncio.Semaphore(MAX_CONCURRENT_UPSERTS)
+
+  async def guarded(fn: Callable[..., Awaitable[None]], kwargs: dict[str, Any], label: str) -> bool:
+    async with sem:
+      try:
+        await fn(**kwargs)
+      except Exception:
+        log.debug("Failed to upsert %s", label, exc_info=True)
+        return False
+      return True
+
+  return list(await asyncio.gather(*(guarded(fn, kwargs, label) for fn, kwargs, label in calls)))
+
+
 async def emit_initial_entities(
   upsert_entity_fn: UpsertEntityFn,
   upsert_relationship_fn: UpsertRelationshipFn,
+  skip_unchanged: bool = False,
 ) -> None:
   """Emit all known meetings and speakers as platform entities.
 
   Called after successful auth during on_load, and again on each tick
-  to refresh entity metadata.
+  to refresh entity metadata. With ``skip_unchanged`` the call returns
+  before building any payloads if the meetings and speakers are the same
+  as at the last emission.
   """
+  global _last_emitted
   state = store.get_state()
+  # The store mutates these containers in place, so compare shallow copies
+  snapshot = (tuple(state.speeches_order), dict(state.speeches), dict(state.speakers))
+  if skip_unchanged and snapshot == _last_emitted:
+    return
+  entity_calls: list[tuple[Callable[..., Awaitable[None]], dict[str, Any], str]] = []
+  rel_calls: list[tuple[Callable[..., Awaitable[None]], dict[str, Any], str]] = []
 
-  # --- Emit meeting entities ---
+  # --- Meeting entities ---
   for speech_id in state.speeches_order:
     speech = state.speeches.get(speech_id)
     if not speech:
       continue
-
-    try:
-      await upsert_entity_fn(
-        type="otter.meeting",
-        source=SOURCE,
-        source_id=speech.speech_id,
-        title=speech.title or f"Meeting {speech.speech_id}",
-        metadata=_meeting_metadata(speech),
+    entity_calls.append(
+      (
+        upsert_entity_fn,
+        {
+          "type": "otter.meeting",
+          "source": SOURCE,
+          "source_id": speech.speech_id,
+          "title": speech.title or f"Meeting {speech.speech_id}",
+          "metadata": _meeting_metadata(speech),
+        },
+        f"meeting entity {speech.speech_id}",
       )
-    except Exception:
-      log.debug("Failed to upsert meeting entity %s", speech.speech_id, exc_info=True)
+    )
 
-  # --- Emit speaker entities ---
+  # --- Speaker entities ---
   for _speaker_id, speaker in state.speakers.items():
-    try:
-      await upsert_entity_fn(
-        type="otter.speaker",
-        source=SOURCE,
-        source_id=speaker.speaker_id,
-        title=speaker.name or f"Speaker {speaker.speaker_id}",
-        metadata={"name": speaker.name},
+    entity_calls.append(
+      (
+        upsert_entity_fn,
+        {
+          "type": "otter.speaker",
+          "source": SOURCE,
+          "source_id": speaker.speaker_id,
+          "title": speaker.name or f"Speaker {speaker.speaker_id}",
+          "metadata": {"name": speaker.name},
+        },
+        f"speaker entity {speaker.speaker_id}",
       )
-    except Exception:
-      log.debug("Failed to upsert speaker entity %s", speaker.speaker_id, exc_info=True)
+    )
 
     # Emit speaker_in relationships for all meetings
     # (we don't have per-meeting speaker data from the list API,
     #  so we emit relationships based on known speakers)
     for speech_id in state.speeches_order:
-      try:
-        await upsert_relationship_fn(
-          source_id=f"{SOURCE}:{speaker.speaker_id}",
-          target_id=f"{SOURCE}:{speech_id}",
-          type="speaker_in",
-          source=SOURCE,
-        )
-      except Exception:
-        log.debug(
-          "Failed to upsert speaker_in for %s -> %s",
-          speaker.speaker_id,
-          speech_id,
-          exc_info=True,
+      rel_calls.append(
+        (
+          upsert_relationship_fn,
+          {
+            "source_id": f"{SOURCE}:{speaker.speaker_id}",
+            "target_id": f"{SOURCE}:{speech_id}",
+            "type": "speaker_in",
+            "source": SOURCE,
+          },
+          f"speaker_in for {speaker.speaker_id} -> {speech_id}",
         )
+      )
+
+  # Payloads are built up front; the reverse-RPC round-trips then overlap.
+  # Entities go first so relationships never reference a missing endpoint.
+  entities_ok = all(await _gather_bounded(entity_calls))
+  rels_ok = all(await _gather_bounded(rel_calls))
+  # Only remember fully delivered snapshots so failed upserts are retried next tick
+  _last_emitted = snapshot if entities_ok and rels_ok else None
 
   log.info(
     "Emitted entities: %d meetings, %d speakers",
@@ -123,37 +180,40 @@ async def emit_summaries(
     log.debug("Cannot get DB for summary emission", exc_info=True)
     return
 
-  store.get_state()
-
   try:
-    cursor = await db.execute(
-      """SELECT summary_type, content, period_start, period_end
+    rows = await db.execute_fetchall(
+      """SELECT summary_type,
+                      CASE WHEN json_valid(content) THEN json_extract(content, '$.meeting_ids') END,
+                      period_start, period_end
                FROM summaries
                ORDER BY created_at DESC
                LIMIT 4"""
     )
-    rows = await cursor.fetchall()
   except Exception:
     log.debug("Failed to query summaries", exc_info=True)
     return
 
   import json
 
+  prepared: list[tuple[str, str, dict[str, Any], list[str]]] = []
   for row in rows:
     summary_type = row[0]
+    # Only the meeting id list is needed; SQLite extracts it so the full
+    # content blob is never decoded in Python
     try:
-      content = json.loads(row[1]) if isinstance(row[1], str) else row[1]
+      meeting_ids = json.loads(row[1]) if row[1] else []
     except (json.JSONDecodeError, TypeError):
-      content = {}
+      meeting_ids = []
+    if not isinstance(meeting_ids, list):
+      meeting_ids = []
     period_start = row[2]
     period_end = row[3]
 
     entity_source_id = f"{summary_type}:{period_start}:{period_end}"
 
     try:
-      start_str = time.strftime("%b %d %H:%M", time.localtime(period_start))
-      end_str = time.strftime("%H:%M", time.localtime(period_end))
-    except (OSError, ValueError):
+      start_str, end_str = _fmt_period(period_start, period_end)
+    except (OSError, ValueError, OverflowError):
       start_str = str(period_start)
       end_str = str(period_end)
 
@@ -164,35 +224,44 @@ async def emit_summaries(
       "start_date": period_start,
       "end_date": period_end,
     }
-
-    try:
-      await upsert_entity_fn(
-        type="otter.summary",
-        source=SOURCE,
-        source_id=entity_source_id,
-        title=title,
-        metadata=meta,
+    prepared.append((entity_source_id, title, meta, meeting_ids))
+
+  # Each upsert is a reverse-RPC round-trip; overlap them, bounded like
+  # emit_initial_entities
+  entity_ok = await _gather_bounded(
+    [
+      (
+        upsert_entity_fn,
+        {
+          "type": "otter.summary",
+          "source": SOURCE,
+          "source_id": entity_source_id,
+          "title": title,
+          "metadata": meta,
+        },
+        f"summary entity {entity_source_id}",
       )
-    except Exception:
-      log.debug("Failed to upsert summary entity %s", entity_source_id, exc_info=True)
-      continue
+      for entity_source_id, title, meta, _ in prepared
+    ]
+  )
 
-    # Emit summarizes relationships
-    meeting_ids = content.get("meeting_ids", [])
-    for meeting_id in meeting_ids:
-      try:
-        await upsert_relationship_fn(
-          source_id=f"{SOURCE}:{entity_source_id}",
-          target_id=f"{SOURCE}:{meeting_id}",
-          type="summarizes",
-          source=SOURCE,
-        )
-      except Exception:
-        log.debug(
-          "Failed to upsert summarizes for %s -> %s",
-          entity_source_id,
-          meeting_id,
-          exc_info=True,
-        )
+  # Emit summarizes relationships for summaries whose entity upsert succeeded
+  await _gather_bounded(
+    [
+      (
+        upsert_relationship_fn,
+        {
+          "source_id": f"{SOURCE}:{entity_source_id}",
+          "target_id": f"{SOURCE}:{meeting_id}",
+          "type": "summarizes",
+          "source": SOURCE,
+        },
+        f"summarizes for {entity_source_id} -> {meeting_id}",
+      )
+      for (entity_source_id, _, _, meeting_ids), ok in zip(prepared, entity_ok, strict=True)
+      if ok
+      for meeting_id in meeting_ids
+    ]
+  )
 
-  log.info("Emitted %d summary entities", len(list(rows)))
+  log.info("Emitted %d summary entities", sum(entity_ok))
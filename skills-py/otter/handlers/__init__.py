@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+from types import MappingProxyType
 from typing import Any
 
 from ..helpers import ToolResult
@@ -11,7 +12,7 @@ from ..helpers import ToolResult
 from . import search, speech, user
 
 # Build dispatch table from handler modules (async functions only)
-DISPATCH: dict[str, Any] = {}
+_dispatch: dict[str, Any] = {}
 
 for mod in (speech, search, user):
   for name in dir(mod):
@@ -19,7 +20,11 @@ for mod in (speech, search, user):
       continue
     fn = getattr(mod, name)
     if inspect.iscoroutinefunction(fn) and fn.__module__ == mod.__name__:
-      DISPATCH[name] = fn
+      _dispatch[name] = fn
+
+
+# Read-only view: the table is fixed once the handler modules are imported
+DISPATCH: MappingProxyType[str, Any] = MappingProxyType(_dispatch)
 
 
 async def dispatch_tool(name: str, arguments: dict[str, Any]) -> ToolResult:
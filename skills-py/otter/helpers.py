@@ -5,12 +5,24 @@ Shared formatting and error handling helpers for the Otter.ai skill.
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import logging
 import time
 from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from enum import Enum
-from typing import Literal
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from .validation import ValidationError
+
+try:
+  import orjson
+
+  ORJSON_AVAILABLE = True
+except ImportError:
+  ORJSON_AVAILABLE = False
 
 log = logging.getLogger("skill.otter.helpers")
 
@@ -20,7 +32,7 @@ log = logging.getLogger("skill.otter.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -31,7 +43,7 @@ class ToolResult:
 # ---------------------------------------------------------------------------
 
 
-class ErrorCategory(str, Enum):
+class ErrorCategory:
   SPEECH = "SPEECH"
   SEARCH = "SEARCH"
   USER = "USER"
@@ -43,16 +55,14 @@ class ErrorCategory(str, Enum):
 def log_and_format_error(
   function_name: str,
   error: Exception,
-  category: str | ErrorCategory | None = None,
+  category: str | None = None,
 ) -> ToolResult:
-  prefix = category.value if isinstance(category, ErrorCategory) else (category or "GEN")
+  prefix = category or "GEN"
   hash_val = sum(ord(c) for c in function_name) % 1000
   error_code = f"{prefix}-ERR-{hash_val:03d}"
 
   log.error("[Otter] Error in %s - Code: %s - %s", function_name, error_code, error)
 
-  from .validation import ValidationError
-
   if isinstance(error, ValidationError):
     user_message = str(error)
   else:
@@ -61,6 +71,25 @@ def log_and_format_error(
   return ToolResult(content=user_message, is_error=True)
 
 
+Handler = Callable[[dict[str, Any]], Awaitable[ToolResult]]
+
+
+def tool_handler(function_name: str, category: str) -> Callable[[Handler], Handler]:
+  """Wrap a tool handler so any exception becomes a formatted error result."""
+
+  def decorate(fn: Handler) -> Handler:
+    @functools.wraps(fn)
+    async def wrapper(args: dict[str, Any]) -> ToolResult:
+      try:
+        return await fn(args)
+      except Exception as e:
+        return log_and_format_error(function_name, e, category)
+
+    return wrapper
+
+  return decorate
+
+
 # ---------------------------------------------------------------------------
 # Formatting
 # ---------------------------------------------------------------------------
@@ -88,6 +117,18 @@ def format_duration(seconds: float) -> str:
   return f"{hours}h {mins}m"
 
 
+def format_timestamp(ts: float, fmt: str = "%Y-%m-%d %H:%M UTC", *, utc: bool = True) -> str:
+  """Format a Unix timestamp at minute resolution, in UTC or (utc=False) local time."""
+  return _format_minute(int(ts // 60), fmt, utc)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_minute(minute: int, fmt: str, utc: bool) -> str:
+  # Meeting listings and summary titles repeat the same days and minutes;
+  # this is the skill's one strftime cache
+  return datetime.fromtimestamp(minute * 60, tz=UTC if utc else None).strftime(fmt)
+
+
 # ---------------------------------------------------------------------------
 # Rate limiter
 # ---------------------------------------------------------------------------
@@ -99,38 +140,47 @@ _RATE_LIMIT = {
   "MAX_CALLS_PER_MINUTE": 30,
 }
 
-_last_call_time: float = 0
-_call_history: deque[float] = deque()
+_NS_PER_MS = 1_000_000
+_WINDOW_NS = 60_000 * _NS_PER_MS
+_MIN_GAP_NS = _RATE_LIMIT["API_READ_DELAY_MS"] * _NS_PER_MS
 
-
-def _purge_old(now_ms: float) -> None:
-  cutoff = now_ms - 60_000
-  while _call_history and _call_history[0] < cutoff:
-    _call_history.popleft()
+# Start times (monotonic ns) of the last MAX_CALLS_PER_MINUTE calls, oldest
+# first. The ring drops the oldest entry on append, so a call checks a single
+# timestamp instead of purging a window, and no 60 s span holds more calls.
+_recent_calls: deque[int] = deque(maxlen=_RATE_LIMIT["MAX_CALLS_PER_MINUTE"])
 
 
 async def enforce_rate_limit(tier: ToolTier) -> None:
-  global _last_call_time
-
   if tier == "state_only":
     return
 
-  now_ms = time.time() * 1000
-  _purge_old(now_ms)
+  # Nothing between reading the window and claiming a slot awaits, so the
+  # check-and-append is atomic on the event loop. A caller that has to wait
+  # re-checks after sleeping, since others may have claimed the slot first.
+  while True:
+    now = time.monotonic_ns()
+    wait_ns = 0
+    if _recent_calls:
+      wait_ns = _recent_calls[-1] + _MIN_GAP_NS - now
+      if len(_recent_calls) == _recent_calls.maxlen:
+        wait_ns = max(wait_ns, _recent_calls[0] + _WINDOW_NS - now)
+    if wait_ns <= 0:
+      _recent_calls.append(now)
+      return
+    await asyncio.sleep(wait_ns / 1e9)
 
-  if len(_call_history) >= _RATE_LIMIT["MAX_CALLS_PER_MINUTE"]:
-    oldest = _call_history[0]
-    wait_ms = oldest + 60_000 - now_ms + 50
-    if wait_ms > 0:
-      await asyncio.sleep(wait_ms / 1000)
-    _purge_old(time.time() * 1000)
 
-  required_delay = _RATE_LIMIT["API_READ_DELAY_MS"]
+# ---------------------------------------------------------------------------
+# JSON
+# ---------------------------------------------------------------------------
 
-  now_ms = time.time() * 1000
-  elapsed = now_ms - _last_call_time
-  if elapsed < required_delay:
-    await asyncio.sleep((required_delay - elapsed) / 1000)
 
-  _last_call_time = time.time() * 1000
-  _call_history.append(_last_call_time)
+def dumps(obj: Any) -> str:
+  """Serialize to JSON text, via orjson when installed."""
+  if ORJSON_AVAILABLE:
+    try:
+      return orjson.dumps(obj).decode()
+    except TypeError:
+      # orjson rejects non-str keys and >64-bit ints; stdlib handles both
+      pass
+  return json.dumps(obj)
@@ -93,7 +93,6 @@ async def on_setup_submit(ctx: Any, step_id: str, values: dict[str, Any]) -> Set
     is_valid = False
   except Exception as exc:
     log.warning("API key validation failed: %s", exc)
-    await client.close()
     return SetupResult(
       status="error",
       errors=[
@@ -8,10 +8,13 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import json
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from dev.types.skill_types import (
@@ -29,21 +32,27 @@ from dev.types.skill_types import (
   ToolResult as SkillToolResult,
 )
 
-from .handlers import dispatch_tool
+from .handlers import DISPATCH, dispatch_tool
 from .setup import on_setup_cancel, on_setup_start, on_setup_submit
 from .tools import TOOL_DEFINITIONS
 
 log = logging.getLogger("skill.otter.skill")
 
 
-def _make_execute(tool_name: str):
-  """Create an async execute function for a given tool name."""
+async def _execute(
+  handler: Callable[[dict[str, Any]], Awaitable[Any]], args: dict[str, Any]
+) -> SkillToolResult:
+  """Run a resolved tool handler and adapt the result for the host."""
+  result = await handler(args)
+  return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  async def execute(args: dict[str, Any]) -> SkillToolResult:
-    result = await dispatch_tool(tool_name, args)
-    return SkillToolResult(content=result.content, is_error=result.is_error)
 
-  return execute
+def _make_execute(tool_name: str):
+  """Bind the shared execute coroutine to a tool's handler (no closure per tool)."""
+  # Resolve the handler once at registration instead of by name on every call;
+  # unknown names still go through dispatch_tool for its error result.
+  handler = DISPATCH.get(tool_name) or functools.partial(dispatch_tool, tool_name)
+  return functools.partial(_execute, handler)
 
 
 def _build_tools() -> list[SkillTool]:
@@ -214,14 +223,15 @@ async def _on_load(ctx: Any) -> None:
   except Exception:
     log.debug("Failed to fetch speakers", exc_info=True)
 
-  store.set_is_initialized(True)
-  store.set_sync_status(last_sync=time.time())
+  with store.batch():
+    store.set_is_initialized(True)
+    store.set_sync_status(last_sync=time.time())
 
   # Emit entities (if the runtime exposes entity upsert methods)
   try:
     from .entities import emit_initial_entities
 
-    upsert_fn = getattr(ctx.entities, "upsert", None) or (getattr(ctx, "_server", {}) and None)
+    upsert_fn = getattr(ctx.entities, "upsert", None)
     rel_fn = getattr(ctx.entities, "upsert_relationship", None)
     if upsert_fn and rel_fn:
       await emit_initial_entities(upsert_fn, rel_fn)
@@ -238,6 +248,9 @@ async def _on_unload(ctx: Any) -> None:
   from .api import speech_api
   from .db.connection import close_db
   from .state import store
+  from .state.sync import stop_host_sync
+
+  await stop_host_sync()
 
   try:
     client = speech_api.get_client()
@@ -246,17 +259,57 @@ async def _on_unload(ctx: Any) -> None:
     pass
 
   with contextlib.suppress(Exception):
+    await speech_api.flush_cache_writes()
     await close_db()
 
   store.reset_state()
   log.info("Otter.ai skill unloaded")
 
 
+async def _write_new_meetings(ctx: Any, new_ids: set[str]) -> None:
+  """Fetch transcripts for newly seen meetings and write them to memory."""
+  from .api import speech_api
+  from .state import store
+
+  for speech_id in new_ids:
+    try:
+      segments = await speech_api.fetch_transcript(speech_id)
+      if segments:
+        speech = store.get_speech(speech_id)
+        title = speech.title if speech else "Untitled"
+        transcript_text = "\n".join(s.text for s in segments[:50])
+        await ctx.memory.write(
+          f"otter/meeting/{speech_id}",
+          json.dumps(
+            {
+              "title": title,
+              "speech_id": speech_id,
+              "transcript_preview": transcript_text[:2000],
+            }
+          ),
+        )
+    except Exception:
+      log.debug("Failed to fetch transcript for new meeting %s", speech_id, exc_info=True)
+
+
+async def _emit_tick_entities(ctx: Any) -> None:
+  """Emit updated entities (if the runtime exposes entity upsert methods)."""
+  try:
+    from .entities import emit_initial_entities
+
+    upsert_fn = getattr(ctx.entities, "upsert", None)
+    rel_fn = getattr(ctx.entities, "upsert_relationship", None)
+    if upsert_fn and rel_fn:
+      await emit_initial_entities(upsert_fn, rel_fn, skip_unchanged=True)
+  except Exception:
+    log.debug("Failed to emit entities on tick", exc_info=True)
+
+
 async def _on_tick(ctx: Any) -> None:
   """Periodic sync — fetch new meetings, update cache, emit entities."""
   from .api import speech_api
   from .db import queries
-  from .db.connection import get_db
+  from .db.connection import get_db, write_lock
   from .state import store
 
   state = store.get_state()
@@ -266,54 +319,28 @@ async def _on_tick(ctx: Any) -> None:
   store.set_sync_status(is_syncing=True)
 
   # Fetch latest speeches
+  new_ids: set[str] = set()
   try:
-    old_ids = set(state.speeches_order)
+    # Bound before the fetch; set_speeches swaps in a new dict, so this keeps the old id set
+    known = state.speeches
     speeches = await speech_api.fetch_speeches(limit=50)
-    new_ids = {s.speech_id for s in speeches} - old_ids
-
-    # For new meetings, fetch transcripts and write to memory
-    for speech_id in new_ids:
-      try:
-        segments = await speech_api.fetch_transcript(speech_id)
-        if segments:
-          speech = store.get_speech(speech_id)
-          title = speech.title if speech else "Untitled"
-          transcript_text = "\n".join(s.text for s in segments[:50])
-          await ctx.memory.write(
-            f"otter/meeting/{speech_id}",
-            json.dumps(
-              {
-                "title": title,
-                "speech_id": speech_id,
-                "transcript_preview": transcript_text[:2000],
-              }
-            ),
-          )
-      except Exception:
-        log.debug("Failed to fetch transcript for new meeting %s", speech_id, exc_info=True)
-
+    new_ids = {s.speech_id for s in speeches if s.speech_id not in known}
   except Exception:
     log.debug("Failed to fetch speeches on tick", exc_info=True)
 
   # Prune old data
   try:
     db = await get_db()
-    await queries.prune_old_data(db)
+    async with write_lock():
+      await queries.prune_old_data(db)
   except Exception:
     log.debug("Failed to prune old data", exc_info=True)
 
-  store.set_sync_status(is_syncing=False, last_sync=time.time())
-
-  # Emit updated entities (if the runtime exposes entity upsert methods)
-  try:
-    from .entities import emit_initial_entities
+  # Entity emission only reads the speech list refreshed above, so it runs
+  # alongside the per-meeting transcript fetches instead of after them
+  await asyncio.gather(_write_new_meetings(ctx, new_ids), _emit_tick_entities(ctx))
 
-    upsert_fn = getattr(ctx.entities, "upsert", None)
-    rel_fn = getattr(ctx.entities, "upsert_relationship", None)
-    if upsert_fn and rel_fn:
-      await emit_initial_entities(upsert_fn, rel_fn)
-  except Exception:
-    log.debug("Failed to emit entities on tick", exc_info=True)
+  store.set_sync_status(is_syncing=False, last_sync=time.time())
 
 
 async def _on_status(ctx: Any) -> dict[str, Any]:
@@ -342,6 +369,9 @@ async def _on_disconnect(ctx: Any) -> None:
   from .api import speech_api
   from .db.connection import close_db
   from .state import store
+  from .state.sync import stop_host_sync
+
+  await stop_host_sync()
 
   try:
     client = speech_api.get_client()
@@ -350,6 +380,7 @@ async def _on_disconnect(ctx: Any) -> None:
     pass
 
   with contextlib.suppress(Exception):
+    await speech_api.flush_cache_writes()
     await close_db()
 
   store.reset_state()
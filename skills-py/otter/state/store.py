@@ -1,12 +1,15 @@
 """
 In-process state store for the Otter.ai runtime skill.
 
-Uses immutable Pydantic models. After each mutation, listeners are notified.
+State is a single OtterState mutated in place. After each mutation, listeners
+are notified.
 """
 
 from __future__ import annotations
 
+import bisect
 import contextlib
+import itertools
 from typing import TYPE_CHECKING
 
 from .types import (
@@ -19,10 +22,13 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-  from collections.abc import Callable
+  from collections.abc import Callable, Iterator
 
 _state: OtterState = initial_state()
 _listeners: list[Callable[[], None]] = []
+# Nesting depth of batch() blocks, and whether a mutation happened inside one
+_batch_depth = 0
+_batch_dirty = False
 
 
 # ---------------------------------------------------------------------------
@@ -44,8 +50,32 @@ def subscribe(listener: Callable[[], None]) -> Callable[[], None]:
   return unsubscribe
 
 
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+  """Group several mutations so listeners are notified once, at the end."""
+  global _batch_depth, _batch_dirty
+  _batch_depth += 1
+  try:
+    yield
+  finally:
+    _batch_depth -= 1
+    if not _batch_depth and _batch_dirty:
+      _batch_dirty = False
+      _fire_listeners()
+
+
 def _notify() -> None:
-  for fn in _listeners:
+  global _batch_dirty
+  _state.version += 1
+  if _batch_depth:
+    _batch_dirty = True
+    return
+  _fire_listeners()
+
+
+def _fire_listeners() -> None:
+  # Iterate a snapshot so a listener may unsubscribe while being notified
+  for fn in tuple(_listeners):
     fn()
 
 
@@ -55,32 +85,26 @@ def _notify() -> None:
 
 
 def set_connection_status(status: OtterConnectionStatus) -> None:
-  global _state
-  updates: dict = {"connection_status": status}
+  _state.connection_status = status
   if status != "error":
-    updates["connection_error"] = None
-  _state = _state.model_copy(update=updates)
+    _state.connection_error = None
   _notify()
 
 
 def set_connection_error(error: str | None) -> None:
-  global _state
-  updates: dict = {"connection_error": error}
+  _state.connection_error = error
   if error:
-    updates["connection_status"] = "error"
-  _state = _state.model_copy(update=updates)
+    _state.connection_status = "error"
   _notify()
 
 
 def set_is_initialized(value: bool) -> None:
-  global _state
-  _state = _state.model_copy(update={"is_initialized": value})
+  _state.is_initialized = value
   _notify()
 
 
 def set_current_user(user: OtterUser | None) -> None:
-  global _state
-  _state = _state.model_copy(update={"current_user": user})
+  _state.current_user = user
   _notify()
 
 
@@ -90,42 +114,41 @@ def set_current_user(user: OtterUser | None) -> None:
 
 
 def set_speeches(speeches: dict[str, OtterSpeech], order: list[str]) -> None:
-  global _state
-  _state = _state.model_copy(
-    update={
-      "speeches": speeches,
-      "speeches_order": order,
-      "total_meetings": len(order),
-    }
-  )
+  _state.speeches = speeches
+  _state.speeches_order = order
+  _state.title_index = {sid: s.title.lower() for sid, s in speeches.items()}
+  _state.total_meetings = len(order)
   _notify()
 
 
 def add_speech(speech: OtterSpeech) -> None:
-  global _state
-  speeches = {**_state.speeches, speech.speech_id: speech}
-  order = (
-    _state.speeches_order
-    if speech.speech_id in _state.speeches_order
-    else [speech.speech_id, *_state.speeches_order]
-  )
-  _state = _state.model_copy(
-    update={
-      "speeches": speeches,
-      "speeches_order": order,
-      "total_meetings": len(order),
-    }
-  )
+  speeches = _state.speeches
+  # speeches and speeches_order hold the same ids; test the dict, not the list
+  if speech.speech_id not in speeches:
+    order = _state.speeches_order
+    # order is newest first; a just-recorded meeting goes straight to the front,
+    # an older one is bisected into place instead of re-sorting the whole list
+    if not order or speech.created_at >= speeches[order[0]].created_at:
+      pos = 0
+    else:
+      pos = bisect.bisect_right(
+        order, -speech.created_at, key=lambda sid: -speeches[sid].created_at
+      )
+    order.insert(pos, speech.speech_id)
+    _state.total_meetings = len(order)
+  speeches[speech.speech_id] = speech
+  _state.title_index[speech.speech_id] = speech.title.lower()
   _notify()
 
 
 def update_speech(speech_id: str, updates: dict) -> None:
-  global _state
   existing = _state.speeches.get(speech_id)
   if not existing:
     return
   updated = existing.model_copy(update=updates)
-  _state = _state.model_copy(update={"speeches": {**_state.speeches, speech_id: updated}})
+  _state.speeches[speech_id] = updated
+  if "title" in updates:
+    _state.title_index[speech_id] = updated.title.lower()
   _notify()
 
 
@@ -133,21 +156,31 @@ def get_speech(speech_id: str) -> OtterSpeech | None:
   return _state.speeches.get(speech_id)
 
 
+def search_cached_speeches(query: str, limit: int) -> list[OtterSpeech]:
+  """Newest-first cached meetings whose title contains ``query`` (case-insensitive)."""
+  q = query.lower()
+  index = _state.title_index
+  hits = (sid for sid in _state.speeches_order if q in index.get(sid, ""))
+  return [_state.speeches[sid] for sid in itertools.islice(hits, limit)]
+
+
 # ---------------------------------------------------------------------------
 # Speakers
 # ---------------------------------------------------------------------------
 
 
 def set_speakers(speakers: dict[str, OtterSpeaker]) -> None:
-  global _state
-  _state = _state.model_copy(update={"speakers": speakers})
+  # Refetches usually return the same speakers; don't wake listeners for a no-op
+  if speakers == _state.speakers:
+    return
+  _state.speakers = speakers
   _notify()
 
 
 def add_speaker(speaker: OtterSpeaker) -> None:
-  global _state
-  speakers = {**_state.speakers, speaker.speaker_id: speaker}
-  _state = _state.model_copy(update={"speakers": speakers})
+  if _state.speakers.get(speaker.speaker_id) == speaker:
+    return
+  _state.speakers[speaker.speaker_id] = speaker
   _notify()
 
 
@@ -157,13 +190,10 @@ def add_speaker(speaker: OtterSpeaker) -> None:
 
 
 def set_sync_status(is_syncing: bool | None = None, last_sync: float | None = None) -> None:
-  global _state
-  updates: dict = {}
   if is_syncing is not None:
-    updates["is_syncing"] = is_syncing
+    _state.is_syncing = is_syncing
   if last_sync is not None:
-    updates["last_sync"] = last_sync
-  _state = _state.model_copy(update=updates)
+    _state.last_sync = last_sync
   _notify()
 
 
@@ -174,5 +204,8 @@ def set_sync_status(is_syncing: bool | None = None, last_sync: float | None = No
 
 def reset_state() -> None:
   global _state
+  # Carry the version over so a reset never looks like an already-seen state
+  version = _state.version
   _state = initial_state()
+  _state.version = version
   _notify()
@@ -7,9 +7,10 @@ is pushed to the host via reverse RPC for React UI consumption.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 OtterConnectionStatus = Literal["disconnected", "connecting", "connected", "error"]
 
@@ -46,8 +47,9 @@ class OtterTranscriptSegment(BaseModel):
   speaker_name: str | None = None
 
 
-class OtterState(BaseModel):
-  """Full in-process state."""
+@dataclass(slots=True)
+class OtterState:
+  """Full in-process state, mutated in place by the store."""
 
   connection_status: OtterConnectionStatus = "disconnected"
   connection_error: str | None = None
@@ -55,10 +57,14 @@ class OtterState(BaseModel):
   is_syncing: bool = False
   last_sync: float | None = None
   current_user: OtterUser | None = None
-  speeches: dict[str, OtterSpeech] = Field(default_factory=dict)
-  speeches_order: list[str] = Field(default_factory=list)
-  speakers: dict[str, OtterSpeaker] = Field(default_factory=dict)
+  speeches: dict[str, OtterSpeech] = field(default_factory=dict)
+  speeches_order: list[str] = field(default_factory=list)
+  # speech_id -> lowercased title, kept in step with speeches for cache search
+  title_index: dict[str, str] = field(default_factory=dict)
+  speakers: dict[str, OtterSpeaker] = field(default_factory=dict)
   total_meetings: int = 0
+  # Bumped on every notify so readers can skip work when nothing changed
+  version: int = 0
 
 
 class OtterHostState(BaseModel):